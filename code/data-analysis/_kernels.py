@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Numeric Kernels for Thesis Data Analysis
+
+Single-pass kernels used by the analysis scripts. When Numba is installed
+the loops are JIT-compiled; otherwise equivalent NumPy implementations are
+used, so the scripts work with or without it. Without Numba, an
+ahead-of-time build made by build_kernels.py is used in preference to the
+NumPy fallback when present (it runs serially, so the parallel JIT kernel
+wins whenever Numba is importable).
+"""
+
+import numpy as np
+from scipy import stats
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+# Ahead-of-time build of the kernels (see build_kernels.py), if present
+try:
+    from _thesis_kernels import corr_matrix as _corr_matrix_aot
+except ImportError:
+    _corr_matrix_aot = None
+
+
+def _group_moments_loop(values, group_ids, n_groups):
+    """
+    Per-group count, mean and sum of squared deviations for every column of
+    ``values`` in one pass (Welford's update), columns in parallel. Rows with
+    a negative group id are skipped, as are NaN values within a column.
+    """
+    n_rows, n_cols = values.shape
+    counts = np.zeros((n_groups, n_cols))
+    means = np.zeros((n_groups, n_cols))
+    m2 = np.zeros((n_groups, n_cols))
+    for j in prange(n_cols):
+        for i in range(n_rows):
+            g = group_ids[i]
+            x = values[i, j]
+            if g < 0 or np.isnan(x):
+                continue
+            counts[g, j] += 1.0
+            delta = x - means[g, j]
+            means[g, j] += delta / counts[g, j]
+            m2[g, j] += delta * (x - means[g, j])
+    return counts, means, m2
+
+
+def _group_moments_numpy(values, group_ids, n_groups):
+    """
+    NumPy fallback for group_moments: one np.bincount over (group, column) cells
+    """
+    n_cols = values.shape[1]
+    cells = group_ids.astype(np.intp)[:, None] * n_cols + np.arange(n_cols)
+    valid = (group_ids >= 0)[:, None] & ~np.isnan(values)
+    cells, vals = cells[valid], values[valid]
+    size = n_groups * n_cols
+    counts = np.bincount(cells, minlength=size).astype(np.float64)
+    sums = np.bincount(cells, weights=vals, minlength=size)
+    means = np.divide(sums, counts, out=np.zeros(size), where=counts > 0)
+    m2 = np.bincount(cells, weights=(vals - means[cells]) ** 2, minlength=size)
+    shape = (n_groups, n_cols)
+    return counts.reshape(shape), means.reshape(shape), m2.reshape(shape)
+
+
+if njit is not None:
+    _group_moments = njit(parallel=True, cache=True)(_group_moments_loop)
+else:
+    _group_moments = _group_moments_numpy
+
+
+def group_moments(values, group_ids, n_groups):
+    """
+    Per-group moments of each column of a (rows, columns) value block
+
+    Args:
+        values (np.ndarray): 1-D or 2-D float array of observations
+        group_ids (np.ndarray): Group code per row, negative for missing
+        n_groups (int): Number of groups
+
+    Returns:
+        tuple: (counts, means, m2) arrays shaped (n_groups,) or (n_groups, columns)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        counts, means, m2 = _group_moments(values[:, None], group_ids, n_groups)
+        return counts[:, 0], means[:, 0], m2[:, 0]
+    # Column-major so each parallel column scan is contiguous
+    return _group_moments(np.asfortranarray(values), group_ids, n_groups)
+
+
+def _corr_matrix_loop(X):
+    """
+    Pearson correlation of the columns of a NaN-free block: per-column mean
+    and spread by Welford's update, then one pass per column pair, both
+    parallel over columns. Constant columns give NaN.
+    """
+    n_rows, n_cols = X.shape
+    means = np.zeros(n_cols)
+    scales = np.zeros(n_cols)
+    for j in prange(n_cols):
+        mean = 0.0
+        m2 = 0.0
+        for i in range(n_rows):
+            delta = X[i, j] - mean
+            mean += delta / (i + 1)
+            m2 += delta * (X[i, j] - mean)
+        means[j] = mean
+        scales[j] = np.sqrt(m2)
+    out = np.empty((n_cols, n_cols))
+    for a in prange(n_cols):
+        for b in range(a, n_cols):
+            s = 0.0
+            for i in range(n_rows):
+                s += (X[i, a] - means[a]) * (X[i, b] - means[b])
+            denom = scales[a] * scales[b]
+            # Explicit NaN: the pycc build raises ZeroDivisionError on s / 0
+            r = s / denom if denom != 0.0 else np.nan
+            out[a, b] = r
+            out[b, a] = r
+    return out
+
+
+def _corr_matrix_numpy(X):
+    """
+    NumPy fallback for corr_matrix: one matrix product over the standardized block
+    """
+    X = np.array(X, dtype=np.float64)
+    X -= X.mean(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        X /= X.std(axis=0)
+        return (X.T @ X) / X.shape[0]
+
+
+if njit is not None:
+    # Eager signature: compiled (or loaded from cache) at import, not on the
+    # first request
+    _corr_matrix = njit('f8[:,:](f8[:,:])', parallel=True, cache=True,
+                        error_model='numpy')(_corr_matrix_loop)
+elif _corr_matrix_aot is not None:
+    _corr_matrix = _corr_matrix_aot
+else:
+    _corr_matrix = _corr_matrix_numpy
+
+
+def corr_matrix(X):
+    """
+    Pearson correlation matrix of the columns of a NaN-free 2-D array
+    
+    Args:
+        X (np.ndarray): Observations in rows, variables in columns
+        
+    Returns:
+        np.ndarray: (columns, columns) correlation matrix
+    """
+    # Column-major so each parallel column scan is contiguous
+    return _corr_matrix(np.asfortranarray(X, dtype=np.float64))
+
+
+def two_sample_t(counts, means, m2):
+    """
+    Independent two-sample t-test (pooled variance, as scipy.stats.ttest_ind)
+    from the moments of two groups; the group axis is 0, so several columns
+    can be tested at once
+
+    Returns:
+        tuple: (t_statistic, p_value)
+    """
+    n0, n1 = counts[0], counts[1]
+    dof = n0 + n1 - 2
+    pooled_var = (m2[0] + m2[1]) / dof
+    t_stat = (means[0] - means[1]) / np.sqrt(pooled_var * (1.0 / n0 + 1.0 / n1))
+    p_value = 2 * stats.t.sf(np.abs(t_stat), dof)
+    return t_stat, p_value
+
+
+def one_way_anova(counts, means, m2):
+    """
+    One-way ANOVA (as scipy.stats.f_oneway) from per-group moments; the group
+    axis is 0 and empty groups are ignored
+
+    Returns:
+        tuple: (f_statistic, p_value)
+    """
+    n = counts.sum(axis=0)
+    k = (counts > 0).sum(axis=0)
+    grand_mean = (counts * means).sum(axis=0) / n
+    ss_between = (counts * (means - grand_mean) ** 2).sum(axis=0)
+    ss_within = m2.sum(axis=0)
+    df_between, df_within = k - 1, n - k
+    f_stat = (ss_between / df_between) / (ss_within / df_within)
+    p_value = stats.f.sf(f_stat, df_between, df_within)
+    return f_stat, p_value
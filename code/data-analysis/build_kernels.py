@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-Time Build of the Analysis Kernels
+
+Compiles the correlation kernel from _kernels.py into a native
+``_thesis_kernels`` extension module next to this script with numba.pycc.
+The build runs serially, so _kernels.py only uses it where Numba is not
+installed (e.g. a deployment that ships the prebuilt extension); with Numba
+available the parallel JIT kernel is used instead.
+
+Run once after installing the dependencies (requires numba and a C compiler):
+
+    python code/data-analysis/build_kernels.py
+"""
+
+import os
+
+from numba.pycc import CC
+
+from _kernels import _corr_matrix_loop
+
+cc = CC('_thesis_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Same loop as the JIT kernel; pycc builds it serially (prange runs as range)
+cc.export('corr_matrix', 'f8[:,:](f8[:,:])')(_corr_matrix_loop)
+
+def main():
+    """
+    Build the kernels extension
+    """
+    print("=== BUILDING ANALYSIS KERNELS ===")
+    cc.compile()
+    print(f"Kernels written to {cc.output_dir}")
+
+if __name__ == "__main__":
+    main()
@@ -10,12 +10,24 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from scipy import stats
 from sklearn.preprocessing import StandardScaler
 from sklearn.decomposition import PCA
 import warnings
 warnings.filterwarnings('ignore')
 
+from _kernels import group_moments, two_sample_t, one_way_anova, corr_matrix
+
+try:
+    import polars as pl
+    import polars.selectors as cs
+except ImportError:
+    pl = None
+
+try:
+    import cupy
+except ImportError:
+    cupy = None
+
 # Set style for better plots
 plt.style.use('seaborn-v0_8')
 sns.set_palette("husl")
@@ -25,65 +37,283 @@ class ThesisDataAnalyzer:
     Main class for conducting thesis data analysis
     """
     
-    def __init__(self, data_path=None):
+    def __init__(self, data_path=None, backend='polars'):
         """
         Initialize the analyzer with optional data path
         
         Args:
             data_path (str): Path to the data file
+            backend (str): 'polars' (lazy queries) or 'pandas'. Falls back to
+                'pandas' when polars is not installed.
         """
-        self.data = None
+        self._data = None
+        self._lf = None
+        self._num_cols = []
+        self._cat_cols = []
+        self._nc = None
+        self.backend = backend if pl is not None else 'pandas'
         self.data_path = data_path
         self.results = {}
         
         if data_path:
             self.load_data(data_path)
     
-    def load_data(self, file_path):
+    @property
+    def data(self):
+        """
+        pandas view of the loaded data. A pending polars frame is collected on
+        first access and dropped, so in-place edits to the frame are seen by
+        the polars queries too. Cached null counts are cleared by the setter
+        and by methods that change the data; after editing missing values in
+        place, assign the frame back to ``data``.
+        """
+        if self._data is None and self._lf is not None:
+            self._data = self._lf.collect(engine='streaming').to_pandas()
+            self._lf = None
+        return self._data
+    
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self._lf = None
+        self._nc = None
+        self._refresh_col_cache()
+    
+    def _refresh_col_cache(self):
+        """
+        Recompute the cached numeric / categorical column lists. Called after
+        every step that replaces the data or changes column dtypes.
+        """
+        if self._data is None and self._lf is not None:
+            schema = self._lf.collect_schema()
+            self._num_cols = [c for c, dt in schema.items() if dt.is_numeric()]
+            self._cat_cols = [c for c, dt in schema.items() if dt in (pl.String, pl.Categorical)]
+        elif self._data is not None:
+            self._num_cols = self._data.select_dtypes(include=[np.number]).columns.tolist()
+            self._cat_cols = self._data.select_dtypes(include=['object', 'category']).columns.tolist()
+        else:
+            self._num_cols = []
+            self._cat_cols = []
+    
+    def _null_counts(self):
+        """
+        Per-column null counts, computed once and cached until the data changes
+        """
+        if self._nc is None:
+            if self._data is None and self._lf is not None:
+                self._nc = self._lf.null_count().collect().to_pandas().iloc[0]
+            else:
+                self._nc = self._data.isna().sum()
+        return self._nc
+    
+    def _has_data(self):
+        """
+        Check for loaded data without converting a polars frame to pandas
+        """
+        return self._data is not None or self._lf is not None
+    
+    def _lazy(self):
+        """
+        Return the current data as a polars LazyFrame. Once the pandas view
+        exists it is the source of truth, so the frame is converted afresh
+        each time and stays in place (with its index) for later edits.
+        """
+        if self._lf is None:
+            return pl.from_pandas(self._data).lazy()
+        return self._lf
+    
+    def _shape(self):
+        """
+        Shape of the current data, counted on the polars frame if not yet converted
+        """
+        if self._data is None and self._lf is not None:
+            n_rows = self._lf.select(pl.len()).collect().item()
+            return (n_rows, len(self._lf.collect_schema()))
+        return self._data.shape
+    
+    @staticmethod
+    def _scan(file_path, categoricals=()):
+        """
+        Open a data file as a polars LazyFrame
+        
+        Args:
+            file_path (str): Path to the data file
+            categoricals (list): CSV columns to parse as Categorical
+        """
+        if file_path.endswith('.csv'):
+            return pl.scan_csv(file_path, schema_overrides={c: pl.Categorical for c in categoricals})
+        elif file_path.endswith('.xlsx') or file_path.endswith('.xls'):
+            return pl.read_excel(file_path).lazy()
+        elif file_path.endswith('.json'):
+            return pl.read_json(file_path).lazy()
+        elif file_path.endswith('.jsonl') or file_path.endswith('.ndjson'):
+            return pl.scan_ndjson(file_path)
+        elif file_path.endswith('.parquet'):
+            return pl.scan_parquet(file_path)
+        else:
+            raise ValueError("Unsupported file format")
+    
+    @staticmethod
+    def _sample_categoricals(file_path, n_rows=1000, max_ratio=0.05):
+        """
+        String columns of a CSV whose leading rows are low-cardinality, so
+        they can be parsed straight into categoricals instead of objects
+        
+        Args:
+            file_path (str): Path to the CSV file
+            n_rows (int): Rows to inspect
+            max_ratio (float): Largest unique/rows ratio treated as categorical
+            
+        Returns:
+            list: Column names
+        """
+        sample = pd.read_csv(file_path, nrows=n_rows)
+        if sample.empty:
+            return []
+        strings = sample.select_dtypes(include='object')
+        return strings.columns[strings.nunique() / len(sample) < max_ratio].tolist()
+    
+    def load_data(self, file_path, preserve_precision=False):
         """
         Load data from various file formats
         
+        With the polars backend the file is read once here by polars'
+        multi-threaded reader; later queries run on the in-memory frame
+        instead of re-scanning the file.
+        
         Args:
             file_path (str): Path to the data file
+            preserve_precision (bool): Keep float64/int64 columns instead of
+                downcasting them after load. Otherwise low-cardinality CSV
+                string columns (judged on the first 1000 rows) are also
+                read directly as categoricals
         """
         try:
-            if file_path.endswith('.csv'):
-                self.data = pd.read_csv(file_path)
-            elif file_path.endswith('.xlsx') or file_path.endswith('.xls'):
-                self.data = pd.read_excel(file_path)
-            elif file_path.endswith('.json'):
-                self.data = pd.read_json(file_path)
+            categoricals = []
+            if file_path.endswith('.csv') and not preserve_precision:
+                categoricals = self._sample_categoricals(file_path)
+            
+            if self.backend == 'polars':
+                lf = self._scan(file_path, categoricals).collect().lazy()
+                self._data = None
+                self._lf = lf
+                columns = lf.collect_schema().names()
             else:
-                raise ValueError("Unsupported file format")
+                if file_path.endswith('.csv'):
+                    self.data = pd.read_csv(file_path, dtype={c: 'category' for c in categoricals})
+                elif file_path.endswith('.xlsx') or file_path.endswith('.xls'):
+                    self.data = pd.read_excel(file_path)
+                elif file_path.endswith('.json'):
+                    self.data = pd.read_json(file_path)
+                elif file_path.endswith('.parquet'):
+                    self.data = pd.read_parquet(file_path)
+                else:
+                    raise ValueError("Unsupported file format")
+                columns = list(self.data.columns)
+            
+            self._nc = None
+            self._refresh_col_cache()
+            if not preserve_precision:
+                self._downcast_numerics()
             
-            print(f"Data loaded successfully: {self.data.shape}")
-            print(f"Columns: {list(self.data.columns)}")
+            print(f"Data loaded successfully: {self._shape()}")
+            print(f"Columns: {columns}")
             
         except Exception as e:
             print(f"Error loading data: {e}")
     
+    def _downcast_numerics(self):
+        """
+        Narrow floats to float32 where the values survive the round trip (the
+        check pd.to_numeric(downcast='float') makes), integers to the smallest
+        type that holds their range, and store low-cardinality string columns
+        as categoricals
+        """
+        if self.backend == 'polars':
+            lf = self._lazy()
+            schema = lf.collect_schema()
+            int_cols = [c for c, dt in schema.items() if dt.is_integer()]
+            float_cols = [c for c, dt in schema.items() if dt == pl.Float64]
+            str_cols = [c for c, dt in schema.items() if dt == pl.String]
+            # Largest float32 round-trip error per float column (NaN-safe)
+            round_trip = [(pl.col(c).cast(pl.Float32).cast(pl.Float64) - pl.col(c))
+                          .abs().fill_nan(0.0).max().alias(f'{c}__err') for c in float_cols]
+            col_stats = lf.select(
+                [pl.len().alias('__rows')]
+                + round_trip
+                + [pl.col(c).min().alias(f'{c}__min') for c in int_cols]
+                + [pl.col(c).max().alias(f'{c}__max') for c in int_cols]
+                + [pl.col(c).n_unique().alias(f'{c}__nunique') for c in str_cols]
+            ).collect().row(0, named=True)
+            
+            # Same absolute tolerance pandas uses for a float64 -> float32 downcast
+            exprs = [pl.col(c).cast(pl.Float32) for c in float_cols
+                     if col_stats[f'{c}__err'] is None or col_stats[f'{c}__err'] <= 5e-4]
+            for c in int_cols:
+                lo, hi = col_stats[f'{c}__min'], col_stats[f'{c}__max']
+                if lo is None:
+                    continue
+                for pl_type, np_type in ((pl.Int8, np.int8), (pl.Int16, np.int16), (pl.Int32, np.int32)):
+                    info = np.iinfo(np_type)
+                    if info.min <= lo and hi <= info.max:
+                        exprs.append(pl.col(c).cast(pl_type))
+                        break
+            n_rows = col_stats['__rows']
+            exprs += [pl.col(c).cast(pl.Categorical) for c in str_cols
+                      if n_rows and col_stats[f'{c}__nunique'] / n_rows < 0.5]
+            self._data = None
+            # Materialized so later queries don't re-run the casts
+            self._lf = lf.with_columns(exprs).collect().lazy()
+        else:
+            for c in self._num_cols:
+                kind = 'float' if np.issubdtype(self.data[c].dtype, np.floating) else 'integer'
+                self.data[c] = pd.to_numeric(self.data[c], downcast=kind)
+            n_rows = len(self.data)
+            for c in self._cat_cols:
+                if n_rows and self.data[c].dtype == object and self.data[c].nunique() / n_rows < 0.5:
+                    self.data[c] = self.data[c].astype('category')
+        self._refresh_col_cache()
+    
     def explore_data(self):
         """
         Perform exploratory data analysis
         """
-        if self.data is None:
+        if not self._has_data():
             print("No data loaded. Please load data first.")
             return
         
         print("\n=== EXPLORATORY DATA ANALYSIS ===")
         
+        if self.backend == 'polars':
+            # Read once; polars computes null counts and describe column-parallel
+            df = self._lazy().collect()
+            memory_mb = df.estimated_size('mb')
+            dtypes = df.schema
+            if self._nc is None:
+                self._nc = df.null_count().to_pandas().iloc[0]
+            missing_data = self._nc
+            # Linear quantiles and no null_count row, as pandas describe()
+            desc = (df.select(cs.numeric()).describe(interpolation='linear')
+                    .filter(pl.col('statistic') != 'null_count')
+                    .to_pandas().set_index('statistic'))
+            desc.index.name = None
+        else:
+            memory_mb = self.data.memory_usage(deep=True).sum() / 1024**2
+            dtypes = self.data.dtypes
+            missing_data = self._null_counts()
+            desc = self.data.describe()
+        
         # Basic information
         print("\n1. Data Overview:")
-        print(f"Shape: {self.data.shape}")
-        print(f"Memory usage: {self.data.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
+        print(f"Shape: {self._shape()}")
+        print(f"Memory usage: {memory_mb:.2f} MB")
         
         # Data types
         print("\n2. Data Types:")
-        print(self.data.dtypes)
+        print(dtypes)
         
         # Missing values
         print("\n3. Missing Values:")
-        missing_data = self.data.isnull().sum()
         if missing_data.sum() > 0:
             print(missing_data[missing_data > 0])
         else:
@@ -91,52 +321,105 @@ class ThesisDataAnalyzer:
         
         # Descriptive statistics
         print("\n4. Descriptive Statistics:")
-        print(self.data.describe())
+        print(desc)
         
         # Store results
         self.results['exploratory'] = {
-            'shape': self.data.shape,
+            'shape': self._shape(),
             'missing_values': missing_data.to_dict(),
-            'descriptive_stats': self.data.describe().to_dict()
+            'descriptive_stats': desc.to_dict()
         }
     
-    def correlation_analysis(self, variables=None):
+    @staticmethod
+    def _corr_matrix(arr, use_gpu=False):
+        """
+        Pearson correlation of the columns of a NaN-free 2-D array, computed by
+        the compiled kernel in _kernels (NumPy matrix product without Numba)
+        
+        Args:
+            arr (np.ndarray): Observations in rows, variables in columns
+            use_gpu (bool): Compute with cupy.corrcoef when cupy is available
+        """
+        if use_gpu and cupy is not None:
+            return cupy.corrcoef(cupy.asarray(arr), rowvar=False).get()
+        
+        return corr_matrix(arr)
+    
+    def correlation_analysis(self, variables=None, use_gpu=False, plot=True):
         """
         Perform correlation analysis
         
         Args:
             variables (list): List of variables to analyze. If None, uses all numeric variables.
+            use_gpu (bool): Compute the matrix on the GPU when cupy is available
+            plot (bool): Draw and save the correlation heatmap
+            
+        Returns:
+            pd.DataFrame: Correlation matrix
         """
-        if self.data is None:
+        if not self._has_data():
             print("No data loaded. Please load data first.")
             return
         
-        # Select numeric variables
-        numeric_data = self.data.select_dtypes(include=[np.number])
-        
-        if variables:
-            numeric_data = numeric_data[variables]
+        # Select numeric variables; on the polars frame only these columns are converted
+        if self.backend == 'polars':
+            lf = self._lazy()
+            if variables:
+                lf = lf.select(variables)
+            numeric_data = lf.select(cs.numeric()).collect().to_pandas()
+        else:
+            numeric_data = self.data[self._num_cols]
+            
+            if variables:
+                numeric_data = numeric_data[variables]
         
         print("\n=== CORRELATION ANALYSIS ===")
         
-        # Correlation matrix
-        corr_matrix = numeric_data.corr()
+        # Correlation matrix; pandas handles pairwise-complete NaN data
+        arr = numeric_data.to_numpy()
+        if np.isnan(arr).any():
+            corr_matrix = numeric_data.corr()
+        else:
+            columns = numeric_data.columns
+            corr_matrix = pd.DataFrame(self._corr_matrix(arr, use_gpu),
+                                       index=columns, columns=columns)
         
         # Display correlation matrix
         print("\nCorrelation Matrix:")
         print(corr_matrix.round(3))
         
         # Create correlation heatmap
-        plt.figure(figsize=(10, 8))
-        sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', center=0,
-                   square=True, linewidths=0.5)
-        plt.title('Correlation Matrix')
-        plt.tight_layout()
-        plt.savefig('correlation_heatmap.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        if plot:
+            plt.figure(figsize=(10, 8))
+            # Format every annotation in one vectorized call
+            annot = np.char.mod('%.2f', corr_matrix.to_numpy())
+            sns.heatmap(corr_matrix, annot=annot, fmt='', cmap='coolwarm', center=0,
+                       square=True, linewidths=0.5)
+            plt.title('Correlation Matrix')
+            plt.tight_layout()
+            plt.savefig('correlation_heatmap.png', dpi=300, bbox_inches='tight')
+            plt.show()
         
         # Store results
         self.results['correlation'] = corr_matrix.to_dict()
+        return corr_matrix
+    
+    def _group_moments(self, group_var, test_var):
+        """
+        Per-group moments of a numeric variable, in one pass over (value,
+        group code) arrays instead of a boolean mask per group
+        
+        Args:
+            group_var (str): Variable used for grouping
+            test_var (str): Numeric variable
+            
+        Returns:
+            tuple: (n_groups, (counts, means, m2))
+        """
+        codes = self.data[group_var].astype('category').cat.codes
+        values = self.data[test_var].to_numpy(dtype=np.float64)
+        n_groups = int(codes.max()) + 1
+        return n_groups, group_moments(values, codes.to_numpy(), n_groups)
     
     def statistical_tests(self, group_var, test_var, test_type='t_test'):
         """
@@ -147,7 +430,7 @@ class ThesisDataAnalyzer:
             test_var (str): Variable to test
             test_type (str): Type of test ('t_test', 'anova', 'chi_square')
         """
-        if self.data is None:
+        if not self._has_data():
             print("No data loaded. Please load data first.")
             return
         
@@ -155,12 +438,9 @@ class ThesisDataAnalyzer:
         
         if test_type == 't_test':
             # Independent t-test
-            groups = self.data[group_var].unique()
-            if len(groups) == 2:
-                group1_data = self.data[self.data[group_var] == groups[0]][test_var]
-                group2_data = self.data[self.data[group_var] == groups[1]][test_var]
-                
-                t_stat, p_value = stats.ttest_ind(group1_data, group2_data)
+            n_groups, (counts, means, m2) = self._group_moments(group_var, test_var)
+            if n_groups == 2:
+                t_stat, p_value = two_sample_t(counts, means, m2)
                 
                 print(f"T-statistic: {t_stat:.4f}")
                 print(f"P-value: {p_value:.4f}")
@@ -175,11 +455,8 @@ class ThesisDataAnalyzer:
         
         elif test_type == 'anova':
             # One-way ANOVA
-            groups = self.data[group_var].unique()
-            group_data = [self.data[self.data[group_var] == group][test_var] 
-                         for group in groups]
-            
-            f_stat, p_value = stats.f_oneway(*group_data)
+            n_groups, (counts, means, m2) = self._group_moments(group_var, test_var)
+            f_stat, p_value = one_way_anova(counts, means, m2)
             
             print(f"F-statistic: {f_stat:.4f}")
             print(f"P-value: {p_value:.4f}")
@@ -192,6 +469,64 @@ class ThesisDataAnalyzer:
                 'significant': p_value < 0.05
             }
     
+    def batch_tests(self, group_vars=None, test_vars=None):
+        """
+        Run the t-test and one-way ANOVA for every (categorical, numeric) pair
+        
+        Args:
+            group_vars (list): Grouping variables. If None, uses all categorical variables.
+            test_vars (list): Variables to test. If None, uses all numeric variables.
+            
+        Returns:
+            pd.DataFrame: t/F statistics and p-values indexed by (group_var, test_var).
+                The t-test columns are NaN unless the grouping has exactly two levels.
+        """
+        if not self._has_data():
+            print("No data loaded. Please load data first.")
+            return
+        
+        if group_vars is None:
+            group_vars = self._cat_cols
+        if test_vars is None:
+            test_vars = self._num_cols
+        test_vars = list(test_vars)
+        
+        print("\n=== BATCH STATISTICAL TESTS ===")
+        
+        # Every numeric column is tested against a grouping in one kernel call
+        values = self.data[test_vars].to_numpy(dtype=np.float64)
+        frames = []
+        for group_var in group_vars:
+            codes = self.data[group_var].astype('category').cat.codes
+            n_groups = int(codes.max()) + 1
+            counts, means, m2 = group_moments(values, codes.to_numpy(), n_groups)
+            
+            f_stat, f_p = one_way_anova(counts, means, m2)
+            if n_groups == 2:
+                t_stat, t_p = two_sample_t(counts, means, m2)
+            else:
+                t_stat = t_p = np.full(len(test_vars), np.nan)
+            
+            frames.append(pd.DataFrame({
+                'group_var': group_var,
+                'test_var': test_vars,
+                't_statistic': t_stat,
+                't_p_value': t_p,
+                'f_statistic': f_stat,
+                'f_p_value': f_p
+            }))
+        
+        if not frames:
+            return pd.DataFrame()
+        
+        batch_results = pd.concat(frames, ignore_index=True)
+        print(batch_results.round(4).to_string(index=False))
+        
+        # Store results
+        self.results['batch_tests'] = batch_results.to_dict('records')
+        
+        return batch_results.set_index(['group_var', 'test_var'])
+    
     def regression_analysis(self, dependent_var, independent_vars):
         """
         Perform regression analysis
@@ -200,7 +535,7 @@ class ThesisDataAnalyzer:
             dependent_var (str): Dependent variable
             independent_vars (list): List of independent variables
         """
-        if self.data is None:
+        if not self._has_data():
             print("No data loaded. Please load data first.")
             return
         
@@ -232,11 +567,85 @@ class ThesisDataAnalyzer:
             'p_values': model.pvalues.to_dict()
         }
     
+    def regress_by(self, group_var, dependent_var, independent_vars):
+        """
+        Fit an OLS regression (with intercept) separately within each group
+        
+        Each group is reduced to its normal-equation sums (X'X, X'y) in one
+        group-by pass, then every group is solved in a single batched call.
+        
+        Args:
+            group_var (str): Variable defining the groups
+            dependent_var (str): Dependent variable
+            independent_vars (list): List of independent variables
+            
+        Returns:
+            pd.DataFrame: Coefficients, observation count and R-squared per group
+        """
+        if not self._has_data():
+            print("No data loaded. Please load data first.")
+            return
+        
+        print(f"\n=== REGRESSION BY {group_var.upper()} ===")
+        
+        independent_vars = list(independent_vars)
+        terms = ['const'] + independent_vars
+        p = len(terms)
+        pairs = [(a, b) for a in range(p) for b in range(a, p)]
+        
+        # Sufficient statistics per group: sums of x_a * x_b, x_a * y, y * y and y
+        if self.backend == 'polars':
+            lf = self._lazy().select([group_var, dependent_var, *independent_vars]).drop_nulls()
+            x = [None] + [pl.col(c).cast(pl.Float64) for c in independent_vars]
+            y = pl.col(dependent_var).cast(pl.Float64)
+            aggs = [pl.len().cast(pl.Float64).alias('xx_0_0'), y.sum().alias('xy_0')]
+            aggs += [x[b].sum().alias(f'xx_0_{b}') for b in range(1, p)]
+            aggs += [(x[a] * x[b]).sum().alias(f'xx_{a}_{b}') for a, b in pairs if a > 0]
+            aggs += [(x[a] * y).sum().alias(f'xy_{a}') for a in range(1, p)]
+            aggs += [(y * y).sum().alias('yy')]
+            sums = (lf.group_by(group_var).agg(aggs).sort(group_var)
+                    .collect().to_pandas().set_index(group_var))
+        else:
+            df = self.data[[group_var, dependent_var, *independent_vars]].dropna()
+            X = np.column_stack([np.ones(len(df)), df[independent_vars].to_numpy(dtype=np.float64)])
+            yv = df[dependent_var].to_numpy(dtype=np.float64)
+            products = {f'xx_{a}_{b}': X[:, a] * X[:, b] for a, b in pairs}
+            products.update({f'xy_{a}': X[:, a] * yv for a in range(p)})
+            products['yy'] = yv * yv
+            sums = pd.DataFrame(products, index=df.index).groupby(df[group_var]).sum()
+        
+        XtX = np.empty((len(sums), p, p))
+        for a, b in pairs:
+            XtX[:, a, b] = XtX[:, b, a] = sums[f'xx_{a}_{b}'].to_numpy()
+        Xty = np.column_stack([sums[f'xy_{a}'].to_numpy() for a in range(p)])
+        yy = sums['yy'].to_numpy()
+        
+        # Batched solve; pinv keeps rank-deficient groups from failing the batch
+        beta = (np.linalg.pinv(XtX) @ Xty[..., None])[..., 0]
+        n = XtX[:, 0, 0]
+        sse = yy - (beta * Xty).sum(axis=1)
+        sst = yy - Xty[:, 0] ** 2 / n
+        
+        group_results = pd.DataFrame(beta, index=sums.index, columns=terms)
+        group_results['n'] = n.astype(int)
+        group_results['r_squared'] = 1 - sse / sst
+        
+        print(group_results.round(4))
+        
+        # Store results
+        self.results['regress_by'] = {
+            'group_var': group_var,
+            'dependent_var': dependent_var,
+            'groups': group_results.to_dict('index')
+        }
+        
+        return group_results
+    
     def create_visualizations(self):
         """
         Create standard visualizations for the data
         """
-        if self.data is None:
+        if not self._has_data():
             print("No data loaded. Please load data first.")
             return
         
@@ -246,11 +655,15 @@ class ThesisDataAnalyzer:
         fig, axes = plt.subplots(2, 2, figsize=(15, 12))
         
         # 1. Distribution plots for numeric variables
-        numeric_cols = self.data.select_dtypes(include=[np.number]).columns[:4]
+        numeric_cols = self._num_cols[:4]
         for i, col in enumerate(numeric_cols):
             if i < 4:
                 row, col_idx = i // 2, i % 2
-                axes[row, col_idx].hist(self.data[col], bins=20, alpha=0.7, edgecolor='black')
+                # Bin in numpy and draw the bars directly
+                arr = self.data[col].to_numpy(dtype=np.float32)
+                counts, edges = np.histogram(arr[~np.isnan(arr)], bins=20)
+                axes[row, col_idx].bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                                       alpha=0.7, edgecolor='black')
                 axes[row, col_idx].set_title(f'Distribution of {col}')
                 axes[row, col_idx].set_xlabel(col)
                 axes[row, col_idx].set_ylabel('Frequency')
@@ -260,7 +673,7 @@ class ThesisDataAnalyzer:
         plt.show()
         
         # 2. Box plots for categorical variables
-        categorical_cols = self.data.select_dtypes(include=['object']).columns
+        categorical_cols = self._cat_cols
         if len(categorical_cols) > 0 and len(numeric_cols) > 0:
             fig, axes = plt.subplots(1, min(3, len(categorical_cols)), figsize=(15, 5))
             if len(categorical_cols) == 1:
@@ -284,28 +697,12 @@ class ThesisDataAnalyzer:
         Args:
             filename (str): Output filename
         """
-        import json
-        
-        # Convert numpy types to native Python types for JSON serialization
-        def convert_numpy(obj):
-            if isinstance(obj, np.integer):
-                return int(obj)
-            elif isinstance(obj, np.floating):
-                return float(obj)
-            elif isinstance(obj, np.ndarray):
-                return obj.tolist()
-            return obj
-        
-        # Convert results to JSON-serializable format
-        json_results = {}
-        for key, value in self.results.items():
-            if isinstance(value, dict):
-                json_results[key] = {k: convert_numpy(v) for k, v in value.items()}
-            else:
-                json_results[key] = convert_numpy(value)
+        import orjson
         
-        with open(filename, 'w') as f:
-            json.dump(json_results, f, indent=2)
+        # orjson serializes numpy scalars/arrays natively; no conversion pass needed
+        options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(self.results, option=options))
         
         print(f"Results saved to {filename}")
 
@@ -12,66 +12,304 @@ This script handles common data preprocessing tasks including:
 
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import StandardScaler, MinMaxScaler, LabelEncoder
+from sklearn.preprocessing import StandardScaler, MinMaxScaler
 from sklearn.impute import SimpleImputer, KNNImputer
 import matplotlib.pyplot as plt
 import seaborn as sns
+from joblib import Parallel, delayed
+from concurrent.futures import ThreadPoolExecutor
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+def _map_columns(func, columns):
+    """
+    Apply func to each column name concurrently on a thread pool; the numpy
+    and pandas kernels doing the work release the GIL
+    
+    Args:
+        func (callable): Function of one column name
+        columns (list): Column names
+        
+    Returns:
+        list: Results in column order
+    """
+    if len(columns) < 2:
+        return [func(col) for col in columns]
+    return Parallel(n_jobs=-1, prefer='threads')(delayed(func)(col) for col in columns)
+
+def _sorted_categorical(series):
+    """
+    Series as a categorical with its categories in sorted order, so label
+    codes match LabelEncoder whatever the row order or earlier dtype
+    
+    Args:
+        series (pd.Series): Column to encode
+        
+    Returns:
+        pd.Series: Categorical series
+    """
+    categorical = series.astype('category')
+    return categorical.cat.reorder_categories(categorical.cat.categories.sort_values())
+
 class DataPreprocessor:
     """
     Class for handling data preprocessing tasks
     """
     
-    def __init__(self, data=None):
+    def __init__(self, data=None, backend='polars'):
         """
         Initialize the preprocessor
         
         Args:
             data (pd.DataFrame): Input data
+            backend (str): 'polars' (lazy queries) or 'pandas'. Falls back to
+                'pandas' when polars is not installed.
         """
+        self._data = None
+        self._lf = None
+        self._num_cols = []
+        self._cat_cols = []
+        self._nc = None
+        self._original_data = None
+        self._original_lf = None
+        self.backend = backend if pl is not None else 'pandas'
         self.data = data
-        self.original_data = None
         self.scalers = {}
         self.encoders = {}
         self.imputers = {}
+        self._pipeline_cache = {}
+        # When a list, progress lines are collected here instead of printed
+        self.messages = None
+    
+    def _print(self, *args):
+        """
+        Report progress: print it, or collect it in ``self.messages``
+        """
+        if self.messages is None:
+            print(*args)
+        else:
+            self.messages.append(' '.join(str(arg) for arg in args))
+    
+    @property
+    def data(self):
+        """
+        pandas view of the data. A pending lazy query is collected on first
+        access and dropped, since pandas methods below mutate the frame in place.
+        Cached null counts are cleared by the setter and by methods that change
+        the data; after editing missing values in place, assign the frame back
+        to ``data``.
+        """
+        if self._data is None and self._lf is not None:
+            self._data = self._lf.collect(engine='streaming').to_pandas()
+            self._lf = None
+        return self._data
+    
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self._lf = None
+        self._nc = None
+        self._refresh_col_cache()
+    
+    @property
+    def original_data(self):
+        """
+        Data as originally loaded, converted from the load-time snapshot on demand
+        """
+        if self._original_data is None and self._original_lf is not None:
+            self._original_data = self._original_lf.collect(engine='streaming').to_pandas()
+        return self._original_data
+    
+    @original_data.setter
+    def original_data(self, value):
+        self._original_data = value
+        self._original_lf = None
+    
+    def _refresh_col_cache(self):
+        """
+        Recompute the cached numeric / categorical column lists. Called after
+        every step that replaces the data or changes column dtypes.
+        """
+        if self._data is None and self._lf is not None:
+            schema = self._lf.collect_schema()
+            self._num_cols = [c for c, dt in schema.items() if dt.is_numeric()]
+            self._cat_cols = [c for c, dt in schema.items() if dt in (pl.String, pl.Categorical)]
+        elif self._data is not None:
+            self._num_cols = self._data.select_dtypes(include=[np.number]).columns.tolist()
+            self._cat_cols = self._data.select_dtypes(include=['object', 'category']).columns.tolist()
+        else:
+            self._num_cols = []
+            self._cat_cols = []
+    
+    def _null_counts(self):
+        """
+        Per-column null counts, computed once and cached until the data changes
+        """
+        if self._nc is None:
+            if self._data is None and self._lf is not None:
+                self._nc = self._lf.null_count().collect().to_pandas().iloc[0]
+            else:
+                self._nc = self._data.isna().sum()
+        return self._nc
+    
+    def _has_data(self):
+        """
+        Check for loaded data without converting a polars frame to pandas
+        """
+        return self._data is not None or self._lf is not None
+    
+    def _lazy(self):
+        """
+        Return the current data as a polars LazyFrame. Callers that write the
+        result back to ``self._lf`` make the lazy query the source of truth.
+        """
+        if self._lf is None:
+            self._lf = pl.from_pandas(self._data).lazy()
+            self._data = None
+        return self._lf
+    
+    def _shape(self):
+        """
+        Shape of the current data, counted on the lazy query if not yet collected
+        """
+        if self._data is None and self._lf is not None:
+            n_rows = self._lf.select(pl.len()).collect().item()
+            return (n_rows, len(self._lf.collect_schema()))
+        return self._data.shape
+    
+    @staticmethod
+    def _scan(file_path):
+        """
+        Open a data file as a polars LazyFrame
+        
+        Args:
+            file_path (str): Path to data file
+        """
+        if file_path.endswith('.csv'):
+            return pl.scan_csv(file_path)
+        elif file_path.endswith('.xlsx') or file_path.endswith('.xls'):
+            return pl.read_excel(file_path).lazy()
+        elif file_path.endswith('.json'):
+            return pl.read_json(file_path).lazy()
+        elif file_path.endswith('.jsonl') or file_path.endswith('.ndjson'):
+            return pl.scan_ndjson(file_path)
+        elif file_path.endswith('.parquet'):
+            return pl.scan_parquet(file_path)
+        else:
+            raise ValueError("Unsupported file format")
         
-    def load_data(self, file_path):
+    def load_data(self, file_path, preserve_precision=False):
         """
         Load data from file
         
+        With the polars backend the file is read once here by polars'
+        multi-threaded reader; later steps run on the in-memory frame, and
+        ``original_data`` is a snapshot of it rather than a re-read of the file.
+        
         Args:
             file_path (str): Path to data file
+            preserve_precision (bool): Keep float64/int64 columns instead of
+                downcasting them after load
         """
         try:
-            if file_path.endswith('.csv'):
-                self.data = pd.read_csv(file_path)
-            elif file_path.endswith('.xlsx') or file_path.endswith('.xls'):
-                self.data = pd.read_excel(file_path)
-            elif file_path.endswith('.json'):
-                self.data = pd.read_json(file_path)
+            if self.backend == 'polars':
+                lf = self._scan(file_path).collect().lazy()
+                self._data = None
+                self._lf = lf
+                self._original_data = None
+                self._original_lf = lf
             else:
-                raise ValueError("Unsupported file format")
+                if file_path.endswith('.csv'):
+                    self.data = pd.read_csv(file_path)
+                elif file_path.endswith('.xlsx') or file_path.endswith('.xls'):
+                    self.data = pd.read_excel(file_path)
+                elif file_path.endswith('.json'):
+                    self.data = pd.read_json(file_path)
+                elif file_path.endswith('.parquet'):
+                    self.data = pd.read_parquet(file_path)
+                else:
+                    raise ValueError("Unsupported file format")
+                
+                self.original_data = self.data.copy()
             
-            self.original_data = self.data.copy()
-            print(f"Data loaded: {self.data.shape}")
+            self._nc = None
+            self._refresh_col_cache()
+            if not preserve_precision:
+                self._downcast_numerics()
+            self._print(f"Data loaded: {self._shape()}")
             
         except Exception as e:
-            print(f"Error loading data: {e}")
+            self._print(f"Error loading data: {e}")
+    
+    def _downcast_numerics(self):
+        """
+        Narrow floats to float32 where the values survive the round trip (the
+        check pd.to_numeric(downcast='float') makes), integers to the smallest
+        type that holds their range, and store low-cardinality string columns
+        as categoricals
+        """
+        if self.backend == 'polars':
+            lf = self._lazy()
+            schema = lf.collect_schema()
+            int_cols = [c for c, dt in schema.items() if dt.is_integer()]
+            float_cols = [c for c, dt in schema.items() if dt == pl.Float64]
+            str_cols = [c for c, dt in schema.items() if dt == pl.String]
+            # Largest float32 round-trip error per float column (NaN-safe)
+            round_trip = [(pl.col(c).cast(pl.Float32).cast(pl.Float64) - pl.col(c))
+                          .abs().fill_nan(0.0).max().alias(f'{c}__err') for c in float_cols]
+            col_stats = lf.select(
+                [pl.len().alias('__rows')]
+                + round_trip
+                + [pl.col(c).min().alias(f'{c}__min') for c in int_cols]
+                + [pl.col(c).max().alias(f'{c}__max') for c in int_cols]
+                + [pl.col(c).n_unique().alias(f'{c}__nunique') for c in str_cols]
+            ).collect().row(0, named=True)
+            
+            # Same absolute tolerance pandas uses for a float64 -> float32 downcast
+            exprs = [pl.col(c).cast(pl.Float32) for c in float_cols
+                     if col_stats[f'{c}__err'] is None or col_stats[f'{c}__err'] <= 5e-4]
+            for c in int_cols:
+                lo, hi = col_stats[f'{c}__min'], col_stats[f'{c}__max']
+                if lo is None:
+                    continue
+                for pl_type, np_type in ((pl.Int8, np.int8), (pl.Int16, np.int16), (pl.Int32, np.int32)):
+                    info = np.iinfo(np_type)
+                    if info.min <= lo and hi <= info.max:
+                        exprs.append(pl.col(c).cast(pl_type))
+                        break
+            n_rows = col_stats['__rows']
+            exprs += [pl.col(c).cast(pl.Categorical) for c in str_cols
+                      if n_rows and col_stats[f'{c}__nunique'] / n_rows < 0.5]
+            self._data = None
+            # Materialized so later steps don't re-run the casts
+            self._lf = lf.with_columns(exprs).collect().lazy()
+        else:
+            for c in self._num_cols:
+                kind = 'float' if np.issubdtype(self.data[c].dtype, np.floating) else 'integer'
+                self.data[c] = pd.to_numeric(self.data[c], downcast=kind)
+            n_rows = len(self.data)
+            for c in self._cat_cols:
+                if n_rows and self.data[c].dtype == object and self.data[c].nunique() / n_rows < 0.5:
+                    self.data[c] = self.data[c].astype('category')
+        self._refresh_col_cache()
     
     def explore_missing_values(self):
         """
         Analyze missing values in the dataset
         """
-        if self.data is None:
-            print("No data loaded")
+        if not self._has_data():
+            self._print("No data loaded")
             return
         
-        print("\n=== MISSING VALUES ANALYSIS ===")
+        self._print("\n=== MISSING VALUES ANALYSIS ===")
         
         # Calculate missing values
-        missing_data = self.data.isnull().sum()
+        missing_data = self._null_counts()
         missing_percent = (missing_data / len(self.data)) * 100
         
         # Create missing values summary
@@ -80,8 +318,8 @@ class DataPreprocessor:
             'Missing_Percent': missing_percent
         }).sort_values('Missing_Percent', ascending=False)
         
-        print("Missing values summary:")
-        print(missing_summary[missing_summary['Missing_Count'] > 0])
+        self._print("Missing values summary:")
+        self._print(missing_summary[missing_summary['Missing_Count'] > 0])
         
         # Visualize missing values
         plt.figure(figsize=(12, 6))
@@ -110,59 +348,124 @@ class DataPreprocessor:
             strategy (str): 'auto', 'mean', 'median', 'mode', 'drop', 'knn'
             columns (list): Specific columns to process
         """
-        if self.data is None:
-            print("No data loaded")
+        if not self._has_data():
+            self._print("No data loaded")
             return
         
-        print(f"\n=== HANDLING MISSING VALUES (Strategy: {strategy}) ===")
+        self._print(f"\n=== HANDLING MISSING VALUES (Strategy: {strategy}) ===")
+        
+        # Only data that is already a polars query takes the lazy path: polars
+        # has no index, so a pandas frame round-tripped through it would lose its own
+        if self.backend == 'polars' and self._lf is not None:
+            self._handle_missing_values_lazy(strategy, columns)
+            self._print(f"Final shape after missing value handling: {self._shape()}")
+            return
         
         if columns is None:
             columns = self.data.columns
         
-        for col in columns:
-            if self.data[col].isnull().sum() > 0:
-                print(f"Processing column: {col}")
-                
-                if strategy == 'auto':
-                    # Choose strategy based on data type
-                    if self.data[col].dtype in ['object', 'category']:
-                        # For categorical data, use mode
-                        mode_value = self.data[col].mode()[0]
-                        self.data[col].fillna(mode_value, inplace=True)
-                        print(f"  - Filled with mode: {mode_value}")
-                    else:
-                        # For numeric data, use median
-                        median_value = self.data[col].median()
-                        self.data[col].fillna(median_value, inplace=True)
-                        print(f"  - Filled with median: {median_value}")
-                
+        if strategy == 'knn':
+            # One imputer over the numeric block so neighbours use every feature
+            numeric_set = set(self._num_cols)
+            numeric = self.data[[col for col in columns if col in numeric_set]]
+            num_cols = [col for col in numeric.columns if numeric[col].notna().any()]
+            if num_cols and self._null_counts()[num_cols].any():
+                imputer = KNNImputer(n_neighbors=5)
+                self.data[num_cols] = imputer.fit_transform(numeric[num_cols].to_numpy())
+                self._nc = None
+                self.imputers['_block'] = (imputer, num_cols)
+                self._print(f"  - Used KNN imputation on {len(num_cols)} numeric columns")
+            self._print(f"Final shape after missing value handling: {self.data.shape}")
+            return
+        
+        null_counts = self._null_counts()[list(columns)]
+        missing_cols = null_counts.index[null_counts > 0].tolist()
+        
+        if strategy == 'drop':
+            for col in missing_cols:
+                self._print(f"Processing column: {col}")
+            self.data = self.data.dropna(subset=missing_cols)
+            self._print(f"  - Dropped rows with missing values")
+        
+        else:
+            # Collect every fill value first, then fill all columns in one call
+            def fill_value(col):
+                if strategy == 'mode' or (strategy == 'auto' and
+                                          self.data[col].dtype in ['object', 'category']):
+                    # For categorical data, use mode
+                    return 'mode', self.data[col].mode()[0]
                 elif strategy == 'mean':
-                    mean_value = self.data[col].mean()
-                    self.data[col].fillna(mean_value, inplace=True)
-                    print(f"  - Filled with mean: {mean_value}")
-                
-                elif strategy == 'median':
-                    median_value = self.data[col].median()
-                    self.data[col].fillna(median_value, inplace=True)
-                    print(f"  - Filled with median: {median_value}")
-                
-                elif strategy == 'mode':
-                    mode_value = self.data[col].mode()[0]
-                    self.data[col].fillna(mode_value, inplace=True)
-                    print(f"  - Filled with mode: {mode_value}")
-                
-                elif strategy == 'drop':
-                    self.data.dropna(subset=[col], inplace=True)
-                    print(f"  - Dropped rows with missing values")
-                
-                elif strategy == 'knn':
-                    # Use KNN imputation for numeric columns
-                    if self.data[col].dtype in ['int64', 'float64']:
-                        imputer = KNNImputer(n_neighbors=5)
-                        self.data[col] = imputer.fit_transform(self.data[[col]])
-                        print(f"  - Used KNN imputation")
+                    return 'mean', self.data[col].mean()
+                elif strategy in ('auto', 'median'):
+                    # For numeric data, use median
+                    return 'median', self.data[col].median()
+                return None, None
+            
+            fill_values = {}
+            for col, (kind, value) in zip(missing_cols, _map_columns(fill_value, missing_cols)):
+                self._print(f"Processing column: {col}")
+                if kind is not None:
+                    fill_values[col] = value
+                    self._print(f"  - Filled with {kind}: {value}")
+            
+            self.data = self.data.fillna(fill_values)
         
-        print(f"Final shape after missing value handling: {self.data.shape}")
+        self._print(f"Final shape after missing value handling: {self.data.shape}")
+    
+    def _handle_missing_values_lazy(self, strategy, columns):
+        """
+        Polars implementation of handle_missing_values: every fill is one
+        expression in a single with_columns, evaluated in parallel.
+        
+        Args:
+            strategy (str): 'auto', 'mean', 'median', 'mode', 'drop', 'knn'
+            columns (list): Specific columns to process
+        """
+        lf = self._lazy()
+        schema = lf.collect_schema()
+        if columns is None:
+            columns = schema.names()
+        columns = list(columns)
+        
+        null_counts = self._null_counts()
+        missing_cols = [col for col in columns if null_counts[col] > 0]
+        for col in missing_cols:
+            self._print(f"Processing column: {col}")
+        
+        if strategy == 'drop':
+            self._lf = lf.drop_nulls(subset=missing_cols).collect().lazy()
+            self._print(f"  - Dropped rows with missing values")
+        
+        elif strategy == 'knn':
+            # One imputer over the numeric block so neighbours use every feature
+            n_rows = self._shape()[0]
+            numeric_cols = [col for col in columns
+                            if schema[col].is_numeric() and null_counts[col] < n_rows]
+            if any(null_counts[col] > 0 for col in numeric_cols):
+                df = lf.collect()
+                imputer = KNNImputer(n_neighbors=5)
+                imputed = imputer.fit_transform(df.select(numeric_cols).to_numpy())
+                df = df.with_columns([pl.Series(col, imputed[:, i])
+                                      for i, col in enumerate(numeric_cols)])
+                self._lf = df.lazy()
+                self.imputers['_block'] = (imputer, numeric_cols)
+                self._print(f"  - Used KNN imputation on {len(numeric_cols)} numeric columns")
+        
+        else:
+            exprs = []
+            for col in missing_cols:
+                is_numeric = schema[col].is_numeric()
+                if strategy == 'mode' or (strategy == 'auto' and not is_numeric):
+                    exprs.append(pl.col(col).fill_null(pl.col(col).drop_nulls().mode().sort().first()))
+                elif strategy == 'mean' and is_numeric:
+                    exprs.append(pl.col(col).fill_null(pl.col(col).mean()))
+                elif strategy in ('auto', 'median') and is_numeric:
+                    exprs.append(pl.col(col).fill_null(pl.col(col).median()))
+            self._lf = lf.with_columns(exprs).collect().lazy()
+            self._print(f"  - Filled {len(exprs)} columns")
+        
+        self._nc = None
+        self._refresh_col_cache()
     
     def detect_outliers(self, method='iqr', columns=None):
         """
@@ -172,60 +475,53 @@ class DataPreprocessor:
             method (str): 'iqr', 'zscore', 'isolation_forest'
             columns (list): Columns to check for outliers
         """
-        if self.data is None:
-            print("No data loaded")
+        if not self._has_data():
+            self._print("No data loaded")
             return
         
         if columns is None:
-            columns = self.data.select_dtypes(include=[np.number]).columns
+            columns = self._num_cols
         
-        print(f"\n=== OUTLIER DETECTION (Method: {method}) ===")
+        self._print(f"\n=== OUTLIER DETECTION (Method: {method}) ===")
         
+        columns = [col for col in columns if col in self.data.columns]
         outlier_info = {}
+        if not columns:
+            return outlier_info
+        
+        # Work on the whole numeric block at once; NaNs are skipped as in pandas
+        arr = self.data[columns].to_numpy(dtype=np.float64)
+        n_rows = len(arr)
+        
+        if method == 'iqr':
+            q1, q3 = np.nanquantile(arr, [0.25, 0.75], axis=0)
+            iqr = q3 - q1
+            lower, upper = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+            counts = ((arr < lower) | (arr > upper)).sum(axis=0)
+        elif method == 'zscore':
+            z_scores = np.abs((arr - np.nanmean(arr, axis=0)) / np.nanstd(arr, axis=0))
+            counts = (z_scores > 3).sum(axis=0)
+        else:
+            return outlier_info
         
-        for col in columns:
-            if col in self.data.columns:
-                print(f"\nAnalyzing column: {col}")
-                
-                if method == 'iqr':
-                    Q1 = self.data[col].quantile(0.25)
-                    Q3 = self.data[col].quantile(0.75)
-                    IQR = Q3 - Q1
-                    lower_bound = Q1 - 1.5 * IQR
-                    upper_bound = Q3 + 1.5 * IQR
-                    
-                    outliers = self.data[(self.data[col] < lower_bound) | 
-                                       (self.data[col] > upper_bound)]
-                    
-                    outlier_count = len(outliers)
-                    outlier_percent = (outlier_count / len(self.data)) * 100
-                    
-                    print(f"  - Outliers: {outlier_count} ({outlier_percent:.2f}%)")
-                    print(f"  - Bounds: [{lower_bound:.2f}, {upper_bound:.2f}]")
-                    
-                    outlier_info[col] = {
-                        'method': 'iqr',
-                        'outlier_count': outlier_count,
-                        'outlier_percent': outlier_percent,
-                        'lower_bound': lower_bound,
-                        'upper_bound': upper_bound
-                    }
-                
-                elif method == 'zscore':
-                    from scipy import stats
-                    z_scores = np.abs(stats.zscore(self.data[col]))
-                    outliers = self.data[z_scores > 3]
-                    
-                    outlier_count = len(outliers)
-                    outlier_percent = (outlier_count / len(self.data)) * 100
-                    
-                    print(f"  - Outliers: {outlier_count} ({outlier_percent:.2f}%)")
-                    
-                    outlier_info[col] = {
-                        'method': 'zscore',
-                        'outlier_count': outlier_count,
-                        'outlier_percent': outlier_percent
-                    }
+        for i, col in enumerate(columns):
+            self._print(f"\nAnalyzing column: {col}")
+            
+            outlier_count = int(counts[i])
+            outlier_percent = (outlier_count / n_rows) * 100
+            
+            self._print(f"  - Outliers: {outlier_count} ({outlier_percent:.2f}%)")
+            
+            outlier_info[col] = {
+                'method': method,
+                'outlier_count': outlier_count,
+                'outlier_percent': outlier_percent
+            }
+            
+            if method == 'iqr':
+                self._print(f"  - Bounds: [{lower[i]:.2f}, {upper[i]:.2f}]")
+                outlier_info[col]['lower_bound'] = lower[i]
+                outlier_info[col]['upper_bound'] = upper[i]
         
         return outlier_info
     
@@ -237,84 +533,96 @@ class DataPreprocessor:
             method (str): 'cap', 'remove', 'transform'
             columns (list): Columns to process
         """
-        if self.data is None:
-            print("No data loaded")
+        if not self._has_data():
+            self._print("No data loaded")
             return
         
         if columns is None:
-            columns = self.data.select_dtypes(include=[np.number]).columns
+            columns = self._num_cols
         
-        print(f"\n=== HANDLING OUTLIERS (Method: {method}) ===")
+        self._print(f"\n=== HANDLING OUTLIERS (Method: {method}) ===")
         
-        for col in columns:
-            if col in self.data.columns:
-                print(f"Processing column: {col}")
-                
-                if method == 'cap':
-                    # Cap outliers at 1st and 99th percentiles
-                    lower_bound = self.data[col].quantile(0.01)
-                    upper_bound = self.data[col].quantile(0.99)
-                    
-                    self.data[col] = self.data[col].clip(lower=lower_bound, upper=upper_bound)
-                    print(f"  - Capped at [{lower_bound:.2f}, {upper_bound:.2f}]")
+        columns = [col for col in columns if col in self.data.columns]
+        
+        if method in ('cap', 'remove') and columns:
+            # Bounds for all columns from one quantile pass over the numeric block
+            block = self.data[columns].to_numpy(copy=True)
+            if not np.issubdtype(block.dtype, np.floating):
+                block = block.astype(np.float64)
+            
+            if method == 'cap':
+                # Cap outliers at 1st and 99th percentiles
+                lower, upper = np.nanquantile(block, [0.01, 0.99], axis=0)
+                np.clip(block, lower, upper, out=block)
+                self.data[columns] = block
+                for i, col in enumerate(columns):
+                    self._print(f"Processing column: {col}")
+                    self._print(f"  - Capped at [{lower[i]:.2f}, {upper[i]:.2f}]")
+            
+            else:
+                # Remove rows outside the IQR fences of any column
+                q1, q3 = np.nanquantile(block, [0.25, 0.75], axis=0)
+                iqr = q3 - q1
+                keep = ((block >= q1 - 1.5 * iqr) & (block <= q3 + 1.5 * iqr)).all(axis=1)
                 
-                elif method == 'remove':
-                    # Remove outliers using IQR method
-                    Q1 = self.data[col].quantile(0.25)
-                    Q3 = self.data[col].quantile(0.75)
-                    IQR = Q3 - Q1
-                    lower_bound = Q1 - 1.5 * IQR
-                    upper_bound = Q3 + 1.5 * IQR
-                    
-                    before_count = len(self.data)
-                    self.data = self.data[(self.data[col] >= lower_bound) & 
-                                        (self.data[col] <= upper_bound)]
-                    after_count = len(self.data)
-                    
-                    print(f"  - Removed {before_count - after_count} outliers")
+                before_count = len(self.data)
+                self.data = self.data.loc[keep]
+                after_count = len(self.data)
                 
-                elif method == 'transform':
-                    # Log transformation for positive skewed data
-                    if self.data[col].min() > 0:
-                        self.data[col] = np.log1p(self.data[col])
-                        print(f"  - Applied log transformation")
+                self._print(f"Processing columns: {columns}")
+                self._print(f"  - Removed {before_count - after_count} outliers")
+        
+        elif method == 'transform':
+            # Log transformation for positive skewed data
+            def log_transform(col):
+                values = self.data[col]
+                return np.log1p(values) if values.min() > 0 else None
+            
+            for col, transformed in zip(columns, _map_columns(log_transform, columns)):
+                self._print(f"Processing column: {col}")
+                if transformed is not None:
+                    self.data[col] = transformed
+                    self._print(f"  - Applied log transformation")
         
-        print(f"Final shape after outlier handling: {self.data.shape}")
+        self._print(f"Final shape after outlier handling: {self.data.shape}")
     
-    def encode_categorical_variables(self, method='label', columns=None):
+    def encode_categorical_variables(self, method='label', columns=None, sparse=False):
         """
         Encode categorical variables
         
         Args:
             method (str): 'label', 'onehot', 'target'
             columns (list): Categorical columns to encode
+            sparse (bool): Build sparse one-hot columns (for high cardinality)
         """
-        if self.data is None:
-            print("No data loaded")
+        if not self._has_data():
+            self._print("No data loaded")
             return
         
         if columns is None:
-            columns = self.data.select_dtypes(include=['object', 'category']).columns
-        
-        print(f"\n=== ENCODING CATEGORICAL VARIABLES (Method: {method}) ===")
-        
-        for col in columns:
-            if col in self.data.columns:
-                print(f"Processing column: {col}")
-                
-                if method == 'label':
-                    # Label encoding
-                    le = LabelEncoder()
-                    self.data[col] = le.fit_transform(self.data[col])
-                    self.encoders[col] = le
-                    print(f"  - Applied label encoding")
-                
-                elif method == 'onehot':
-                    # One-hot encoding
-                    dummies = pd.get_dummies(self.data[col], prefix=col)
-                    self.data = pd.concat([self.data, dummies], axis=1)
-                    self.data.drop(col, axis=1, inplace=True)
-                    print(f"  - Applied one-hot encoding")
+            columns = self._cat_cols
+        columns = [col for col in columns if col in self.data.columns]
+        
+        self._print(f"\n=== ENCODING CATEGORICAL VARIABLES (Method: {method}) ===")
+        
+        if method == 'label':
+            # Factorize columns concurrently, then write back serially
+            categoricals = _map_columns(lambda col: _sorted_categorical(self.data[col]), columns)
+            for col, categorical in zip(columns, categoricals):
+                self._print(f"Processing column: {col}")
+                # Label encoding via categorical codes; categories kept for inverse mapping
+                self.data[col] = categorical.cat.codes
+                self.encoders[col] = categorical.cat.categories
+                self._print(f"  - Applied label encoding")
+            self._nc = None
+            self._refresh_col_cache()
+        
+        elif method == 'onehot' and columns:
+            # One-hot encode every column in a single allocation
+            for col in columns:
+                self._print(f"Processing column: {col}")
+            self.data = pd.get_dummies(self.data, columns=columns, sparse=sparse, dtype=np.int8)
+            self._print(f"  - Applied one-hot encoding")
     
     def scale_features(self, method='standard', columns=None):
         """
@@ -324,71 +632,272 @@ class DataPreprocessor:
             method (str): 'standard', 'minmax', 'robust'
             columns (list): Numerical columns to scale
         """
-        if self.data is None:
-            print("No data loaded")
+        if not self._has_data():
+            self._print("No data loaded")
             return
         
         if columns is None:
-            columns = self.data.select_dtypes(include=[np.number]).columns
+            columns = self._num_cols
+        
+        self._print(f"\n=== SCALING FEATURES (Method: {method}) ===")
         
-        print(f"\n=== SCALING FEATURES (Method: {method}) ===")
+        columns = [col for col in columns if col in self.data.columns]
+        if method == 'standard':
+            scaler = StandardScaler(copy=False)
+        elif method == 'minmax':
+            scaler = MinMaxScaler(copy=False)
+        else:
+            return
+        if not columns:
+            return
         
         for col in columns:
-            if col in self.data.columns:
-                print(f"Processing column: {col}")
-                
-                if method == 'standard':
-                    # Standard scaling
-                    scaler = StandardScaler()
-                    self.data[col] = scaler.fit_transform(self.data[[col]])
-                    self.scalers[col] = scaler
-                    print(f"  - Applied standard scaling")
-                
-                elif method == 'minmax':
-                    # Min-max scaling
-                    scaler = MinMaxScaler()
-                    self.data[col] = scaler.fit_transform(self.data[[col]])
-                    self.scalers[col] = scaler
-                    print(f"  - Applied min-max scaling")
+            self._print(f"Processing column: {col}")
+        
+        # Fit one scaler over the whole numeric block and write it back at once
+        block = self.data[columns].to_numpy(copy=True)
+        self.data[columns] = scaler.fit_transform(block)
+        self.scalers['_block'] = (scaler, columns)
+        self._print(f"  - Applied {method} scaling to {len(columns)} columns")
     
     def create_features(self):
         """
         Create new features from existing ones
         """
-        if self.data is None:
-            print("No data loaded")
+        if not self._has_data():
+            self._print("No data loaded")
             return
         
-        print("\n=== CREATING NEW FEATURES ===")
+        self._print("\n=== CREATING NEW FEATURES ===")
         
         # Example feature creation (modify based on your data)
-        numeric_cols = self.data.select_dtypes(include=[np.number]).columns
+        numeric_cols = self._num_cols
         
         if len(numeric_cols) >= 2:
-            # Create interaction features
-            for i in range(len(numeric_cols)):
-                for j in range(i+1, len(numeric_cols)):
-                    col1, col2 = numeric_cols[i], numeric_cols[j]
-                    self.data[f'{col1}_x_{col2}'] = self.data[col1] * self.data[col2]
-                    print(f"  - Created interaction: {col1}_x_{col2}")
+            # Create all pairwise interaction features in one broadcast product
+            A = self.data[numeric_cols].to_numpy(dtype=np.float32)
+            i, j = np.triu_indices(len(numeric_cols), 1)
+            names = [f'{numeric_cols[a]}_x_{numeric_cols[b]}' for a, b in zip(i, j)]
+            interactions = pd.DataFrame(A[:, i] * A[:, j], columns=names, index=self.data.index)
+            self.data = pd.concat([self.data, interactions], axis=1)
+            for name in names:
+                self._print(f"  - Created interaction: {name}")
         
         # Create polynomial features for important variables
         # (modify based on your specific needs)
         
-        print(f"Final shape after feature creation: {self.data.shape}")
+        self._print(f"Final shape after feature creation: {self.data.shape}")
     
-    def save_processed_data(self, filename='processed_data.csv'):
+    def compile_pipeline(self, steps):
+        """
+        Compile preprocessing steps into a single function specialized to the
+        current columns and dtypes. Each step runs one block-level kernel over
+        its columns; no strategy strings are re-checked per column at run time.
+        
+        Args:
+            steps (list): Step tuples, applied in order:
+                ('fillna', 'median' | 'mean' | 'mode', columns)
+                ('clip_outliers', lower_quantile, upper_quantile, columns)
+                ('label_encode', columns)
+                ('scale', 'standard' | 'minmax', columns)
+                A columns entry of None means all numeric columns (all
+                categorical columns for 'label_encode').
+            
+        Returns:
+            callable: Function taking and returning a pd.DataFrame
+        """
+        steps = [tuple(step[:-1]) + (tuple(step[-1]) if step[-1] is not None else None,)
+                 for step in steps]
+        key = (tuple(steps), tuple(self._num_cols), tuple(self._cat_cols),
+               tuple(self.data.dtypes.astype(str)))
+        if key in self._pipeline_cache:
+            return self._pipeline_cache[key]
+        
+        kernels = [self._compile_step(step) for step in steps]
+        
+        def pipeline(df):
+            for kernel in kernels:
+                df = kernel(df)
+            return df
+        
+        self._pipeline_cache[key] = pipeline
+        return pipeline
+    
+    def _compile_step(self, step):
+        """
+        Build the block-level kernel for one compile_pipeline step
+        
+        Args:
+            step (tuple): Normalized step tuple
+        """
+        name, columns = step[0], step[-1]
+        if columns is None:
+            columns = self._cat_cols if name == 'label_encode' else self._num_cols
+        columns = [col for col in columns if col in self.data.columns]
+        
+        if name == 'fillna':
+            strategy = step[1]
+            if strategy == 'median':
+                fill = lambda block: block.median()
+            elif strategy == 'mean':
+                fill = lambda block: block.mean()
+            elif strategy == 'mode':
+                fill = lambda block: block.mode().iloc[0]
+            else:
+                raise ValueError(f"Unknown fill strategy: {strategy}")
+            
+            def kernel(df):
+                return df.fillna(fill(df[columns]).to_dict())
+        
+        elif name == 'clip_outliers':
+            lower_q, upper_q = step[1], step[2]
+            
+            def kernel(df):
+                block = df[columns].to_numpy(dtype=np.float64)
+                lower, upper = np.nanquantile(block, [lower_q, upper_q], axis=0)
+                np.clip(block, lower, upper, out=block)
+                df[columns] = block
+                return df
+        
+        elif name == 'label_encode':
+            def kernel(df):
+                for col in columns:
+                    categorical = _sorted_categorical(df[col])
+                    df[col] = categorical.cat.codes
+                    self.encoders[col] = categorical.cat.categories
+                return df
+        
+        elif name == 'scale':
+            scaler_cls = {'standard': StandardScaler, 'minmax': MinMaxScaler}[step[1]]
+            
+            def kernel(df):
+                scaler = scaler_cls(copy=False)
+                df[columns] = scaler.fit_transform(df[columns].to_numpy(dtype=np.float64))
+                self.scalers['_block'] = (scaler, columns)
+                return df
+        
+        else:
+            raise ValueError(f"Unknown pipeline step: {name}")
+        
+        if not columns:
+            return lambda df: df
+        return kernel
+    
+    def run_pipeline(self, steps):
+        """
+        Compile (or reuse) a pipeline for the current data and apply it
+        
+        Args:
+            steps (list): Step tuples, see compile_pipeline
+        """
+        if not self._has_data():
+            self._print("No data loaded")
+            return
+        
+        self._print(f"\n=== RUNNING PIPELINE ({len(steps)} steps) ===")
+        self.data = self.compile_pipeline(steps)(self.data)
+        self._print(f"Final shape after pipeline: {self.data.shape}")
+    
+    def apply_numeric(self, df_num, config):
+        """
+        Run the numeric stages of a config (missing values, outliers,
+        scaling) on a slice of numeric columns
+        
+        Args:
+            df_num (pd.DataFrame): Numeric columns
+            config (dict): handle_missing/missing_method, handle_outliers/
+                outlier_method, scale_features/scaling_method
+            
+        Returns:
+            tuple: (processed slice, progress lines)
+        """
+        stage = DataPreprocessor(df_num, backend='pandas')
+        stage.messages = []
+        if config.get('handle_missing'):
+            stage.handle_missing_values(strategy=config.get('missing_method', 'auto'))
+        if config.get('handle_outliers'):
+            stage.handle_outliers(method=config.get('outlier_method', 'cap'))
+        if config.get('scale_features'):
+            stage.scale_features(method=config.get('scaling_method', 'standard'))
+        self.imputers.update(stage.imputers)
+        self.scalers.update(stage.scalers)
+        return stage.data, stage.messages
+    
+    def apply_categorical(self, df_cat, config):
+        """
+        Run the categorical stages of a config (missing values, encoding) on
+        a slice of categorical columns
+        
+        Args:
+            df_cat (pd.DataFrame): Categorical columns
+            config (dict): handle_missing/missing_method, encode_categorical/
+                encoding_method
+            
+        Returns:
+            tuple: (processed slice, progress lines)
+        """
+        stage = DataPreprocessor(df_cat, backend='pandas')
+        stage.messages = []
+        if config.get('handle_missing'):
+            stage.handle_missing_values(strategy=config.get('missing_method', 'auto'))
+        if config.get('encode_categorical'):
+            stage.encode_categorical_variables(method=config.get('encoding_method', 'label'))
+        self.encoders.update(stage.encoders)
+        return stage.data, stage.messages
+    
+    def apply_config(self, config):
+        """
+        Apply a preprocessing config; the numeric and categorical column
+        groups are disjoint, so their stages run concurrently
+        
+        Args:
+            config (dict): Options read by apply_numeric and apply_categorical
+        """
+        if not self._has_data():
+            self._print("No data loaded")
+            return
+        
+        df = self.data
+        num_cols, cat_cols = list(self._num_cols), list(self._cat_cols)
+        grouped = set(num_cols) | set(cat_cols)
+        other_cols = [col for col in df.columns if col not in grouped]
+        
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            numeric = pool.submit(self.apply_numeric, df[num_cols], config)
+            categorical = pool.submit(self.apply_categorical, df[cat_cols], config)
+            (df_num, numeric_log), (df_cat, categorical_log) = numeric.result(), categorical.result()
+        
+        # Each stage collected its progress lines; report them in order
+        for line in numeric_log + categorical_log:
+            self._print(line)
+        parts = [df_num, df_cat, df[other_cols]]
+        
+        # Inner join keeps only rows that survived row-dropping stages on both sides
+        result = pd.concat(parts, axis=1, join='inner')
+        # Original column order first, then columns added by one-hot encoding
+        order = [col for col in df.columns if col in result.columns]
+        added = [col for col in result.columns if col not in set(order)]
+        self.data = result[order + added]
+        self._print(f"Final shape after preprocessing: {self.data.shape}")
+    
+    def save_processed_data(self, filename='processed_data.parquet'):
         """
         Save processed data to file
         
+        Writes zstd-compressed Parquet unless the filename ends in .csv.
+        
         Args:
             filename (str): Output filename
         """
         if self.data is not None:
-            self.data.to_csv(filename, index=False)
-            print(f"Processed data saved to {filename}")
+            if filename.endswith('.csv'):
+                self.data.to_csv(filename, index=False)
+            else:
+                self.data.to_parquet(filename, engine='pyarrow', compression='zstd',
+                                     index=False, use_dictionary=True)
+            self._print(f"Processed data saved to {filename}")
         else:
-            print("No data to save")
+            self._print("No data to save")
     
     def get_preprocessing_summary(self):
         """
@@ -396,15 +905,15 @@ class DataPreprocessor:
         """
         summary = {
             'original_shape': self.original_data.shape if self.original_data is not None else None,
-            'current_shape': self.data.shape if self.data is not None else None,
+            'current_shape': self._shape() if self._has_data() else None,
             'scalers_applied': list(self.scalers.keys()),
             'encoders_applied': list(self.encoders.keys()),
             'imputers_applied': list(self.imputers.keys())
         }
         
-        print("\n=== PREPROCESSING SUMMARY ===")
+        self._print("\n=== PREPROCESSING SUMMARY ===")
         for key, value in summary.items():
-            print(f"{key}: {value}")
+            self._print(f"{key}: {value}")
         
         return summary
 
@@ -14,8 +14,47 @@ import numpy as np
 from datetime import datetime
 import json
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Column-name cleaning patterns
+_SPECIAL_CHARS = re.compile(r'[^\w\s]')
+_WHITESPACE_RUNS = re.compile(r'\s+')
+
+# Format -> writer/reader dispatch tables for the multi-file helpers
+_WRITERS = {
+    'csv': lambda df, filename: df.to_csv(filename, index=False),
+    'xlsx': lambda df, filename: df.to_excel(filename, index=False),
+    'json': lambda df, filename: df.to_json(filename, orient='records', indent=2),
+    'parquet': lambda df, filename: df.to_parquet(filename, engine='pyarrow',
+                                                  compression='zstd', index=False),
+}
+
+_READERS = {
+    '.csv': lambda path: pd.read_csv(path, engine='pyarrow'),
+    '.xlsx': pd.read_excel,
+    '.xls': pd.read_excel,
+    '.json': pd.read_json,
+    '.parquet': lambda path: pd.read_parquet(path, engine='pyarrow'),
+}
+
+# Polars fast paths for the CSV/Parquet formats; the others use pandas
+_POLARS_WRITERS = {
+    'csv': lambda df, filename: pl.from_pandas(df).write_csv(filename),
+    'parquet': lambda df, filename: pl.from_pandas(df).write_parquet(filename, compression='zstd'),
+}
+
+_POLARS_READERS = {
+    '.csv': lambda path: pl.read_csv(path).to_pandas(),
+    '.parquet': lambda path: pl.read_parquet(path).to_pandas(),
+}
+
 class DataUtils:
     """
     Utility class for data operations
@@ -52,18 +91,19 @@ class DataUtils:
                 validation_results['issues'].append(f"Missing required columns: {missing_columns}")
         
         # Check for duplicate rows
-        if df.duplicated().sum() > 0:
-            validation_results['warnings'].append(f"Found {df.duplicated().sum()} duplicate rows")
+        dup_count = int(df.duplicated().sum())
+        if dup_count > 0:
+            validation_results['warnings'].append(f"Found {dup_count} duplicate rows")
         
         # Check for missing values
-        missing_counts = df.isnull().sum()
-        if missing_counts.sum() > 0:
-            validation_results['warnings'].append(f"Found {missing_counts.sum()} missing values")
+        missing_total = int(df.isna().to_numpy().sum())
+        if missing_total > 0:
+            validation_results['warnings'].append(f"Found {missing_total} missing values")
         
         # Check for infinite values
         numeric_cols = df.select_dtypes(include=[np.number]).columns
         if len(numeric_cols) > 0:
-            inf_counts = np.isinf(df[numeric_cols]).sum().sum()
+            inf_counts = int(np.isinf(df[numeric_cols].to_numpy(copy=False)).sum())
             if inf_counts > 0:
                 validation_results['warnings'].append(f"Found {inf_counts} infinite values")
         
@@ -82,10 +122,11 @@ class DataUtils:
         """
         df_clean = df.copy()
         
-        # Remove special characters and spaces
-        df_clean.columns = df_clean.columns.str.replace(r'[^\w\s]', '', regex=True)
-        df_clean.columns = df_clean.columns.str.replace(r'\s+', '_', regex=True)
-        df_clean.columns = df_clean.columns.str.lower()
+        # Remove special characters and spaces (patterns compiled once per module)
+        df_clean.columns = (df_clean.columns
+                            .str.replace(_SPECIAL_CHARS, '', regex=True)
+                            .str.replace(_WHITESPACE_RUNS, '_', regex=True)
+                            .str.lower())
         
         return df_clean
     
@@ -100,59 +141,76 @@ class DataUtils:
         Returns:
             Dict[str, str]: Dictionary mapping columns to suggested data types
         """
-        type_suggestions = {}
+        dtypes = df.dtypes.astype(str)
         
-        for col in df.columns:
-            # Check if it's a date column
-            if col.lower() in ['date', 'time', 'timestamp', 'created', 'updated']:
-                type_suggestions[col] = 'datetime'
-                continue
-            
-            # Check if it's categorical
-            unique_ratio = df[col].nunique() / len(df)
-            if unique_ratio < 0.1 and df[col].dtype == 'object':
-                type_suggestions[col] = 'category'
-                continue
-            
-            # Check if it's numeric
-            if df[col].dtype in ['int64', 'float64']:
-                type_suggestions[col] = 'numeric'
-                continue
-            
-            # Default to object
-            type_suggestions[col] = 'object'
+        # Check if it's a date column
+        datetime_mask = df.columns.astype(str).str.lower().isin(
+            ['date', 'time', 'timestamp', 'created', 'updated'])
+        
+        # Check if it's categorical (one nunique pass over all columns)
+        unique_ratio = (df.nunique() / len(df)).to_numpy()
+        category_mask = ~datetime_mask & (((unique_ratio < 0.1) & (dtypes == 'object').to_numpy())
+                                          | (dtypes == 'category').to_numpy())
+        
+        # Check if it's numeric
+        numeric_mask = ~datetime_mask & ~category_mask & dtypes.isin(['int64', 'float64']).to_numpy()
+        
+        # Default to object
+        labels = np.select([datetime_mask, category_mask, numeric_mask],
+                           ['datetime', 'category', 'numeric'], default='object')
         
-        return type_suggestions
+        return dict(zip(df.columns, labels.tolist()))
     
     @staticmethod
-    def create_summary_statistics(df: pd.DataFrame) -> Dict[str, Any]:
+    def create_summary_statistics(df: pd.DataFrame, deep_memory: bool = False) -> Dict[str, Any]:
         """
         Create comprehensive summary statistics
         
         Args:
             df (pd.DataFrame): Dataframe to analyze
+            deep_memory (bool): Measure the contents of object columns in
+                memory_usage_mb (slow on large string columns)
             
         Returns:
             Dict[str, Any]: Summary statistics
         """
+        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        descriptive_stats = {}
+        if len(numeric_cols) > 0:
+            # describe()'s rows from two block reductions on the numeric subset
+            numeric_df = df[numeric_cols]
+            aggregates = numeric_df.agg(['count', 'mean', 'std', 'min', 'max'])
+            quantiles = numeric_df.quantile([0.25, 0.5, 0.75]).set_axis(['25%', '50%', '75%'])
+            stats_df = pd.concat([aggregates.iloc[:4], quantiles, aggregates.iloc[4:]])
+            # describe() also covers datetime columns (no std); keep them, in column order
+            datetime_cols = df.select_dtypes(include=['datetime', 'datetimetz']).columns
+            if len(datetime_cols) > 0:
+                stats_df = pd.concat([stats_df, df[datetime_cols].describe()], axis=1)
+                stats_df = stats_df[[col for col in df.columns if col in stats_df.columns]]
+            descriptive_stats = stats_df.to_dict()
+        
         summary = {
             'basic_info': {
                 'shape': df.shape,
-                'memory_usage_mb': df.memory_usage(deep=True).sum() / 1024**2,
+                'memory_usage_mb': df.memory_usage(deep=deep_memory).sum() / 1024**2,
                 'dtypes': df.dtypes.to_dict()
             },
             'missing_values': df.isnull().sum().to_dict(),
-            'descriptive_stats': df.describe().to_dict() if len(df.select_dtypes(include=[np.number]).columns) > 0 else {},
+            'descriptive_stats': descriptive_stats,
             'categorical_info': {}
         }
         
         # Add categorical column information
         categorical_cols = df.select_dtypes(include=['object', 'category']).columns
         for col in categorical_cols:
+            # One value_counts pass gives the unique count and the mode; category
+            # columns list unused categories with a zero count, so skip those
+            value_counts = df[col].value_counts()
+            unique_count = int((value_counts > 0).sum())
             summary['categorical_info'][col] = {
-                'unique_count': df[col].nunique(),
-                'most_common': df[col].mode().iloc[0] if not df[col].mode().empty else None,
-                'most_common_count': df[col].value_counts().iloc[0] if not df[col].value_counts().empty else 0
+                'unique_count': unique_count,
+                'most_common': value_counts.index[0] if unique_count else None,
+                'most_common_count': int(value_counts.iloc[0]) if unique_count else 0
             }
         
         return summary
@@ -169,10 +227,13 @@ class DataUtils:
             condition_value (Any): Value to split on
             
         Returns:
-            tuple: (matching_data, non_matching_data)
+            tuple: (matching_data, non_matching_data). Both are new frames
+            built by boolean indexing; no extra copy is taken
         """
-        matching = df[df[condition_col] == condition_value].copy()
-        non_matching = df[df[condition_col] != condition_value].copy()
+        # One equality scan; the complement is its negation
+        mask = (df[condition_col] == condition_value).to_numpy()
+        matching = df[mask]
+        non_matching = df[~mask]
         
         return matching, non_matching
     
@@ -188,29 +249,34 @@ class DataUtils:
         Returns:
             pd.DataFrame: Sample dataset
         """
-        np.random.seed(seed)
+        rng = np.random.default_rng(seed)
         
         # Create sample data
         data = {
-            'id': range(1, n_samples + 1),
-            'age': np.random.normal(35, 10, n_samples).astype(int),
-            'income': np.random.lognormal(10, 0.5, n_samples),
-            'education': np.random.choice(['High School', 'Bachelor', 'Master', 'PhD'], n_samples),
-            'satisfaction': np.random.randint(1, 11, n_samples),
+            'id': np.arange(1, n_samples + 1),
+            'age': rng.normal(35, 10, n_samples).astype(int),
+            'income': rng.lognormal(10, 0.5, n_samples),
+            'education': pd.Categorical.from_codes(rng.integers(0, 4, n_samples, dtype=np.int8),
+                                                   categories=['High School', 'Bachelor', 'Master', 'PhD']),
+            'satisfaction': rng.integers(1, 11, n_samples),
             'date': pd.date_range('2023-01-01', periods=n_samples, freq='D'),
-            'category': np.random.choice(['A', 'B', 'C'], n_samples)
+            'category': pd.Categorical.from_codes(rng.integers(0, 3, n_samples, dtype=np.int8),
+                                                  categories=['A', 'B', 'C'])
         }
         
-        # Add some missing values
-        for col in ['age', 'income', 'satisfaction']:
-            mask = np.random.random(n_samples) < 0.05  # 5% missing values
-            data[col][mask] = np.nan
+        # Add some missing values (5% per column, one mask draw for all three)
+        missing_cols = ['age', 'income', 'satisfaction']
+        masks = rng.random((len(missing_cols), n_samples)) < 0.05
+        for mask, col in zip(masks, missing_cols):
+            data[col] = np.where(mask, np.nan, data[col].astype(float))
         
-        return pd.DataFrame(data)
+        # The arrays above are freshly allocated, so hand them over without copying
+        return pd.DataFrame(data, copy=False)
     
     @staticmethod
     def export_to_multiple_formats(df: pd.DataFrame, base_filename: str, 
-                                 formats: List[str] = ['csv', 'xlsx', 'json']) -> List[str]:
+                                 formats: List[str] = ['csv', 'xlsx', 'json'],
+                                 backend: str = 'pandas') -> List[str]:
         """
         Export dataframe to multiple formats
         
@@ -218,24 +284,35 @@ class DataUtils:
             df (pd.DataFrame): Dataframe to export
             base_filename (str): Base filename without extension
             formats (List[str]): List of formats to export to
+            backend (str): 'pandas' or 'polars' (CSV/Parquet written by polars
+                when it is installed)
             
         Returns:
             List[str]: List of created filenames
         """
         created_files = []
+        writers = _WRITERS
+        if backend == 'polars' and pl is not None:
+            writers = {**_WRITERS, **_POLARS_WRITERS}
         
+        supported = [fmt for fmt in formats if fmt in writers]
         for fmt in formats:
+            if fmt not in writers:
+                print(f"Unsupported export format: {fmt}")
+        if not supported:
+            return created_files
+        
+        # Formats are independent; write them concurrently (the writers
+        # spend most of their time in I/O and C code that releases the GIL)
+        with ThreadPoolExecutor(max_workers=len(supported)) as executor:
+            futures = {fmt: executor.submit(writers[fmt], df, f"{base_filename}.{fmt}")
+                       for fmt in supported}
+        
+        for fmt, future in futures.items():
             filename = f"{base_filename}.{fmt}"
             
             try:
-                if fmt == 'csv':
-                    df.to_csv(filename, index=False)
-                elif fmt == 'xlsx':
-                    df.to_excel(filename, index=False)
-                elif fmt == 'json':
-                    df.to_json(filename, orient='records', indent=2)
-                elif fmt == 'parquet':
-                    df.to_parquet(filename, index=False)
+                future.result()
                 
                 created_files.append(filename)
                 print(f"Exported to {filename}")
@@ -246,31 +323,30 @@ class DataUtils:
         return created_files
     
     @staticmethod
-    def load_multiple_files(file_paths: List[str]) -> Dict[str, pd.DataFrame]:
+    def load_multiple_files(file_paths: List[str], backend: str = 'pandas') -> Dict[str, pd.DataFrame]:
         """
         Load multiple files into a dictionary
         
         Args:
             file_paths (List[str]): List of file paths to load
+            backend (str): 'pandas' or 'polars' (CSV/Parquet parsed by polars
+                when it is installed, converted to pandas on return)
             
         Returns:
             Dict[str, pd.DataFrame]: Dictionary mapping filenames to dataframes
         """
         dataframes = {}
+        readers = _READERS
+        if backend == 'polars' and pl is not None:
+            readers = {**_READERS, **_POLARS_READERS}
         
         for file_path in file_paths:
             try:
-                if file_path.endswith('.csv'):
-                    df = pd.read_csv(file_path)
-                elif file_path.endswith('.xlsx') or file_path.endswith('.xls'):
-                    df = pd.read_excel(file_path)
-                elif file_path.endswith('.json'):
-                    df = pd.read_json(file_path)
-                elif file_path.endswith('.parquet'):
-                    df = pd.read_parquet(file_path)
-                else:
+                reader = readers.get(os.path.splitext(file_path)[1].lower())
+                if reader is None:
                     print(f"Unsupported file format: {file_path}")
                     continue
+                df = reader(file_path)
                 
                 filename = os.path.basename(file_path)
                 dataframes[filename] = df
@@ -303,26 +379,37 @@ class DataUtils:
             'variables': {}
         }
         
+        # Precompute column statistics in bulk instead of per-column scans
+        dtypes = df.dtypes
+        missing_counts = df.isna().sum()
+        numeric_cols = [col for col in df.columns if dtypes[col] in ['int64', 'float64']]
+        categorical_cols = [col for col in df.columns if dtypes[col] in ['object', 'category']]
+        # Only mean/std in the block call: min/max over mixed int/float columns
+        # would upcast to float, so they are taken per column in their own dtype
+        numeric_stats = df[numeric_cols].agg(['mean', 'std']) if numeric_cols else pd.DataFrame()
+        categorical_stats = df[categorical_cols].describe() if categorical_cols else pd.DataFrame()
+        
         for col in df.columns:
             var_info = {
-                'type': str(df[col].dtype),
+                'type': str(dtypes[col]),
                 'description': f'Description for {col}',
-                'missing_count': df[col].isnull().sum(),
-                'missing_percentage': (df[col].isnull().sum() / len(df)) * 100
+                'missing_count': missing_counts[col],
+                'missing_percentage': (missing_counts[col] / len(df)) * 100
             }
             
             # Add type-specific information
-            if df[col].dtype in ['int64', 'float64']:
+            if col in numeric_stats:
                 var_info.update({
                     'min': df[col].min(),
                     'max': df[col].max(),
-                    'mean': df[col].mean(),
-                    'std': df[col].std()
+                    'mean': numeric_stats.at['mean', col],
+                    'std': numeric_stats.at['std', col]
                 })
-            elif df[col].dtype in ['object', 'category']:
+            elif col in categorical_stats:
+                top = categorical_stats.loc['top', col]
                 var_info.update({
-                    'unique_values': df[col].nunique(),
-                    'most_common': df[col].mode().iloc[0] if not df[col].mode().empty else None
+                    'unique_values': categorical_stats.loc['unique', col],
+                    'most_common': top if pd.notna(top) else None
                 })
             
             data_dict['variables'][col] = var_info
@@ -374,10 +461,13 @@ class DataUtils:
                             'mean_difference': df1[col].mean() - df2[col].mean()
                         }
                     else:
+                        # Hash-based unique/intersection instead of Python sets
+                        unique1 = pd.Index(df1[col].unique())
+                        unique2 = pd.Index(df2[col].unique())
                         comparison['column_analysis'][col] = {
                             'df1_unique': df1[col].nunique(),
                             'df2_unique': df2[col].nunique(),
-                            'common_values': len(set(df1[col]) & set(df2[col]))
+                            'common_values': len(unique1.intersection(unique2))
                         }
         
         return comparison
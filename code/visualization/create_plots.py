@@ -18,6 +18,7 @@ import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from statsmodels.nonparametric.kde import KDEUnivariate
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -37,8 +38,49 @@ class ThesisVisualizer:
         Args:
             data (pd.DataFrame): Input data
         """
+        self._matrix_cache = None
         self.data = data
         self.figures = {}
+    
+    @property
+    def data(self):
+        """
+        Data being visualized; assigning it drops the cached numeric matrix
+        """
+        return self._data
+    
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self._matrix_cache = None
+    
+    def _numeric_matrix(self, columns):
+        """
+        Float64 ndarray of the given columns, materialized once and reused
+        until the data is replaced
+        """
+        key = tuple(columns)
+        if self._matrix_cache is None or self._matrix_cache[0] != key:
+            self._matrix_cache = (key, self.data[list(columns)].to_numpy(dtype=np.float64))
+        return self._matrix_cache[1]
+    
+    def _correlation(self, columns):
+        """
+        Pearson correlation of the given columns as a labelled DataFrame
+        
+        Args:
+            columns (list): Numeric columns
+            
+        Returns:
+            pd.DataFrame: Correlation matrix
+        """
+        mat = self._numeric_matrix(columns)
+        if np.isnan(mat).any():
+            # Pairwise-complete correlation needs pandas' masked path
+            corr = self.data[list(columns)].corr().to_numpy()
+        else:
+            corr = np.atleast_2d(np.corrcoef(mat, rowvar=False))
+        return pd.DataFrame(corr, index=columns, columns=columns)
         
     def load_data(self, file_path):
         """
@@ -54,6 +96,8 @@ class ThesisVisualizer:
                 self.data = pd.read_excel(file_path)
             elif file_path.endswith('.json'):
                 self.data = pd.read_json(file_path)
+            elif file_path.endswith('.parquet'):
+                self.data = pd.read_parquet(file_path)
             else:
                 raise ValueError("Unsupported file format")
             
@@ -81,25 +125,21 @@ class ThesisVisualizer:
         n_cols = min(3, len(columns))
         n_rows = (len(columns) + n_cols - 1) // n_cols
         
-        fig, axes = plt.subplots(n_rows, n_cols, figsize=(15, 5*n_rows))
-        if n_rows == 1:
-            axes = axes.reshape(1, -1)
-        elif n_cols == 1:
-            axes = axes.reshape(-1, 1)
+        fig, axes = plt.subplots(n_rows, n_cols, figsize=(15, 5*n_rows), squeeze=False)
         
         for i, col in enumerate(columns):
-            row = i // n_cols
-            col_idx = i % n_cols
+            row, col_idx = divmod(i, n_cols)
             
-            # Histogram with KDE
-            axes[row, col_idx].hist(self.data[col], bins=30, alpha=0.7, density=True, 
-                                   edgecolor='black', color='skyblue')
+            # Histogram with KDE (binned once in numpy, drawn as steps)
+            values = self.data[col].dropna().to_numpy(dtype=float)
+            counts, edges = np.histogram(values, bins=30, density=True)
+            axes[row, col_idx].stairs(counts, edges, fill=True, alpha=0.7,
+                                      edgecolor='black', facecolor='skyblue')
             
-            # Add KDE curve
-            from scipy.stats import gaussian_kde
-            kde = gaussian_kde(self.data[col].dropna())
-            x_range = np.linspace(self.data[col].min(), self.data[col].max(), 100)
-            axes[row, col_idx].plot(x_range, kde(x_range), 'r-', linewidth=2)
+            # Add KDE curve (FFT-binned, evaluated on a grid spanning the data)
+            kde = KDEUnivariate(values)
+            kde.fit(kernel='gau', bw='scott', fft=True, cut=0)
+            axes[row, col_idx].plot(kde.support, kde.density, 'r-', linewidth=2)
             
             axes[row, col_idx].set_title(f'Distribution of {col}')
             axes[row, col_idx].set_xlabel(col)
@@ -108,8 +148,7 @@ class ThesisVisualizer:
         
         # Hide empty subplots
         for i in range(len(columns), n_rows * n_cols):
-            row = i // n_cols
-            col_idx = i % n_cols
+            row, col_idx = divmod(i, n_cols)
             axes[row, col_idx].set_visible(False)
         
         plt.tight_layout()
@@ -133,7 +172,7 @@ class ThesisVisualizer:
         if columns is None:
             columns = self.data.select_dtypes(include=[np.number]).columns
         
-        corr_matrix = self.data[columns].corr()
+        corr_matrix = self._correlation(columns)
         
         plt.figure(figsize=(12, 10))
         mask = np.triu(np.ones_like(corr_matrix, dtype=bool))
@@ -263,13 +302,14 @@ class ThesisVisualizer:
         
         # 1. Data overview
         numeric_cols = self.data.select_dtypes(include=[np.number]).columns
+        missing_data = self.data.isna().sum()
         if len(numeric_cols) > 0:
             # Summary statistics
             summary_stats = self.data[numeric_cols].describe()
             axes[0, 0].text(0.1, 0.9, 'Summary Statistics', fontsize=14, fontweight='bold')
             axes[0, 0].text(0.1, 0.8, f'Total observations: {len(self.data)}', fontsize=10)
             axes[0, 0].text(0.1, 0.7, f'Numeric variables: {len(numeric_cols)}', fontsize=10)
-            axes[0, 0].text(0.1, 0.6, f'Missing values: {self.data.isnull().sum().sum()}', fontsize=10)
+            axes[0, 0].text(0.1, 0.6, f'Missing values: {int(missing_data.sum())}', fontsize=10)
             axes[0, 0].set_xlim(0, 1)
             axes[0, 0].set_ylim(0, 1)
             axes[0, 0].axis('off')
@@ -284,7 +324,7 @@ class ThesisVisualizer:
         
         # 3. Correlation heatmap (if multiple numeric variables)
         if len(numeric_cols) > 1:
-            corr_matrix = self.data[numeric_cols].corr()
+            corr_matrix = self._correlation(numeric_cols)
             im = axes[1, 0].imshow(corr_matrix, cmap='coolwarm', aspect='auto')
             axes[1, 0].set_title('Correlation Matrix')
             axes[1, 0].set_xticks(range(len(numeric_cols)))
@@ -294,7 +334,6 @@ class ThesisVisualizer:
             plt.colorbar(im, ax=axes[1, 0])
         
         # 4. Missing values visualization
-        missing_data = self.data.isnull().sum()
         if missing_data.sum() > 0:
             missing_data = missing_data[missing_data > 0]
             axes[1, 1].bar(range(len(missing_data)), missing_data.values)
@@ -321,6 +360,8 @@ class ThesisVisualizer:
             print("No data loaded")
             return
         
+        numeric_cols = self.data.select_dtypes(include=[np.number]).columns
+        
         if plot_type == 'violin':
             # Violin plot
             plt.figure(figsize=(10, 6))
@@ -330,15 +371,14 @@ class ThesisVisualizer:
         
         elif plot_type == 'pair':
             # Pair plot
-            numeric_data = self.data.select_dtypes(include=[np.number])
-            if len(numeric_data.columns) > 1:
-                sns.pairplot(numeric_data)
+            if len(numeric_cols) > 1:
+                sns.pairplot(self.data[numeric_cols])
                 plt.show()
         
         elif plot_type == 'joint':
             # Joint plot
-            if len(self.data.select_dtypes(include=[np.number]).columns) >= 2:
-                cols = self.data.select_dtypes(include=[np.number]).columns[:2]
+            if len(numeric_cols) >= 2:
+                cols = numeric_cols[:2]
                 sns.jointplot(data=self.data, x=cols[0], y=cols[1])
                 plt.show()
     
@@ -409,7 +449,7 @@ def main():
     visualizer = ThesisVisualizer()
     
     # Example usage (uncomment and modify as needed)
-    # visualizer.load_data('data/processed_data.csv')
+    # visualizer.load_data('data/processed_data.parquet')
     # visualizer.create_distribution_plots()
     # visualizer.create_correlation_heatmap()
     # visualizer.create_research_summary_plot()
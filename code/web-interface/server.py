@@ -4,45 +4,167 @@ Thesis Framework Web Interface Server
 Provides a web interface for the thesis framework with backend integration
 """
 
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from flask import Flask, Response, render_template, request, jsonify, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 import os
 import json
+import functools
+import gzip
+import sqlite3
+import threading
+import orjson
 from datetime import datetime
-import pandas as pd
+from string import Template
 import sys
-import os
 
-# Add the parent directory to the path to import our analysis modules
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'data-analysis'))
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'tools'))
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 try:
-    from main_analysis import ThesisDataAnalyzer
-    from preprocess import DataPreprocessor
-    from data_utils import DataUtils
+    from flask_compress import Compress
 except ImportError:
-    print("Warning: Could not import analysis modules. Some features may not be available.")
+    Compress = None
+
+# Add the parent directory to the path to import our analysis modules; they
+# pull in pandas/sklearn/matplotlib, so they are imported on first use only
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'data-analysis'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'tools'))
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider for jsonify/request.json backed by orjson"""
+    
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+    
+    def dumps(self, obj, **kwargs):
+        # Types orjson lacks (Decimal, ...) go through Flask's default hook
+        return orjson.dumps(obj, option=self.option, default=self.default).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Compress larger dynamic responses when flask-compress is installed
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 1024
+if Compress is not None:
+    Compress(app)
 
 # Configure the template and static folders
 app.template_folder = '.'
 app.static_folder = '.'
 
+# Absolute asset directories so static responses don't depend on the cwd
+WEB_DIR = os.path.dirname(os.path.abspath(__file__))
+JS_DIR = os.path.join(WEB_DIR, 'js')
+SAMPLE_DATA_PATH = os.path.join(WEB_DIR, '..', '..', 'data', 'sample_data.csv')
+FRAMEWORKS_DB = os.environ.get('THESIS_FRAMEWORKS_DB', os.path.join(WEB_DIR, 'frameworks.db'))
+FRAMEWORKS_DIR = os.path.join(WEB_DIR, 'frameworks')
+_frameworks_dir_ready = False
+
+# Behind Apache mod_xsendfile or lighttpd, let the proxy stream static files
+# from disk (X-Sendfile) instead of passing them through the Python process;
+# nginx ignores X-Sendfile, so leave this off there
+app.config['USE_X_SENDFILE'] = os.environ.get('THESIS_USE_X_SENDFILE') == '1'
+
 class ThesisFrameworkServer:
-    def __init__(self):
-        self.frameworks = {}
+    def __init__(self, db_path=FRAMEWORKS_DB):
+        # Saved frameworks live in SQLite (WAL mode), so they survive restarts
+        # and are shared by every worker process; the lock serializes the
+        # request threads on the shared connection
+        self.db_path = db_path
+        self._db = None
+        self.db_lock = threading.Lock()
+        # Serialized list pages, valid while the table is unchanged
+        self._list_cache = {}
+        self._list_version = None
+        self._saves = 0
         self.data_analyzer = None
+        # mtime of SAMPLE_DATA_PATH when data_analyzer loaded it
+        self.data_analyzer_mtime_ns = None
         self.preprocessor = None
+        # The preprocessor mutates its data in place; one request at a time
+        self.preprocessor_lock = threading.Lock()
+    
+    @property
+    def db(self):
+        """SQLite connection, opened (and the schema created) on first use,
+        so importing the module creates no files; callers hold db_lock"""
+        if self._db is None:
+            db = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+            db.execute('CREATE TABLE IF NOT EXISTS fw '
+                       '(id TEXT PRIMARY KEY, title TEXT, created_at TEXT, data BLOB)')
+            db.execute('CREATE INDEX IF NOT EXISTS fw_created_at ON fw (created_at)')
+            self._db = db
+        return self._db
+    
+    def save_framework(self, framework_id, title, created_at, data):
+        """Insert (or replace) a framework record"""
+        with self.db_lock:
+            self.db.execute('INSERT OR REPLACE INTO fw VALUES (?, ?, ?, ?)',
+                            (framework_id, title, created_at, orjson.dumps(data)))
+            self._saves += 1
+    
+    def _list_page(self, limit, offset):
+        rows = self.db.execute('SELECT id, title, created_at FROM fw '
+                               'ORDER BY created_at DESC LIMIT ? OFFSET ?',
+                               (limit, offset)).fetchall()
+        return [{'id': fid, 'title': title, 'created_at': created_at}
+                for fid, title, created_at in rows]
+    
+    def list_frameworks(self, limit=100, offset=0):
+        """Newest frameworks first, one page at a time"""
+        with self.db_lock:
+            return self._list_page(limit, offset)
+    
+    def list_frameworks_json(self, limit=100, offset=0):
+        """
+        list_frameworks page as JSON bytes, cached until the table changes
+        (data_version moves on commits from other connections, _saves on ours)
+        """
+        with self.db_lock:
+            version = (self.db.execute('PRAGMA data_version').fetchone()[0], self._saves)
+            if version != self._list_version:
+                self._list_cache = {}
+                self._list_version = version
+            blob = self._list_cache.get((limit, offset))
+            if blob is None:
+                blob = orjson.dumps(self._list_page(limit, offset))
+                if len(self._list_cache) < 32:
+                    self._list_cache[(limit, offset)] = blob
+            return blob
+    
+    def get_framework(self, framework_id):
+        """Framework record by id, or None"""
+        with self.db_lock:
+            row = self.db.execute('SELECT title, created_at, data FROM fw WHERE id = ?',
+                                  (framework_id,)).fetchone()
+        if row is None:
+            return None
+        title, created_at, data = row
+        return {'data': orjson.loads(data), 'created_at': created_at, 'title': title}
         
     def initialize_analysis_tools(self):
         """Initialize the data analysis tools if available"""
+        try:
+            from main_analysis import ThesisDataAnalyzer
+            from preprocess import DataPreprocessor
+        except ImportError:
+            print("Warning: Could not import analysis modules. Some features may not be available.")
+            return False
+        
         try:
             # Try to load sample data for demonstration
-            sample_data_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'sample_data.csv')
-            if os.path.exists(sample_data_path):
-                self.data_analyzer = ThesisDataAnalyzer(sample_data_path)
-                self.preprocessor = DataPreprocessor(sample_data_path)
+            if os.path.exists(SAMPLE_DATA_PATH):
+                self.data_analyzer_mtime_ns = os.stat(SAMPLE_DATA_PATH).st_mtime_ns
+                self.data_analyzer = ThesisDataAnalyzer(SAMPLE_DATA_PATH)
+                self.preprocessor = DataPreprocessor()
+                self.preprocessor.load_data(SAMPLE_DATA_PATH)
                 return True
         except Exception as e:
             print(f"Could not initialize analysis tools: {e}")
@@ -51,39 +173,85 @@ class ThesisFrameworkServer:
 # Initialize the server
 server = ThesisFrameworkServer()
 
+# Cleared while the background warm-up runs; routes wait on it briefly so
+# they don't race the warm-up into loading everything twice
+analysis_ready = threading.Event()
+analysis_ready.set()
+
+def warm_up_analysis():
+    """Import the analysis tools and run the sample analysis once, so the
+    first request doesn't pay for imports, JIT compilation and CSV parsing"""
+    try:
+        if server.initialize_analysis_tools():
+            _analyze_sample_data(SAMPLE_DATA_PATH, os.stat(SAMPLE_DATA_PATH).st_mtime_ns)
+    except Exception as e:
+        print(f"Analysis warm-up failed: {e}")
+    finally:
+        analysis_ready.set()
+
+def start_warm_up():
+    """Run warm_up_analysis on a daemon thread"""
+    analysis_ready.clear()
+    threading.Thread(target=warm_up_analysis, daemon=True).start()
+
+INDEX_PATH = os.path.join(WEB_DIR, 'index.html')
+_index_cache = {'mtime_ns': None, 'body': None}
+_index_lock = threading.Lock()
+
+def _index_body():
+    """index.html bytes and mtime, re-read only when the file changes"""
+    mtime_ns = os.stat(INDEX_PATH).st_mtime_ns
+    with _index_lock:
+        if _index_cache['mtime_ns'] != mtime_ns:
+            with open(INDEX_PATH, 'rb') as f:
+                _index_cache['body'] = f.read()
+            _index_cache['mtime_ns'] = mtime_ns
+        return _index_cache['body'], mtime_ns
+
 @app.route('/')
 def index():
     """Serve the main thesis framework interface"""
-    return send_from_directory('.', 'index.html')
+    if app.config['USE_X_SENDFILE']:
+        return send_from_directory(WEB_DIR, 'index.html')
+    
+    # Served from memory: no open()/read() per request, same caching headers
+    body, mtime_ns = _index_body()
+    response = Response(body, mimetype='text/html')
+    response.set_etag(str(mtime_ns))
+    response.last_modified = mtime_ns / 1e9
+    return response.make_conditional(request)
 
 @app.route('/js/<path:filename>')
 def serve_js(filename):
     """Serve JavaScript files"""
-    return send_from_directory('js', filename)
+    return send_from_directory(JS_DIR, filename)
 
 @app.route('/api/save-framework', methods=['POST'])
 def save_framework():
     """Save a thesis framework to the server"""
     try:
         data = request.json
-        framework_id = f"framework_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # One clock read for the id, the record and the file footer
+        now = datetime.now()
+        framework_id = f"framework_{now:%Y%m%d_%H%M%S}"
         
         # Save framework data
-        server.frameworks[framework_id] = {
-            'data': data,
-            'created_at': datetime.now().isoformat(),
-            'title': data.get('tentativeTitle', 'Untitled Framework')
-        }
+        server.save_framework(framework_id, data.get('tentativeTitle', 'Untitled Framework'),
+                              now.isoformat(), data)
         
         # Create framework file
-        framework_content = generate_framework_content(data)
-        framework_path = os.path.join('frameworks', f'{framework_id}.md')
+        framework_content = generate_framework_content(data, now)
+        framework_path = os.path.join(FRAMEWORKS_DIR, f'{framework_id}.md')
         
-        # Ensure frameworks directory exists
-        os.makedirs('frameworks', exist_ok=True)
+        # Ensure frameworks directory exists (checked on the first save only)
+        global _frameworks_dir_ready
+        if not _frameworks_dir_ready:
+            os.makedirs(FRAMEWORKS_DIR, exist_ok=True)
+            _frameworks_dir_ready = True
         
-        with open(framework_path, 'w', encoding='utf-8') as f:
-            f.write(framework_content)
+        # Encode once and write the bytes in a single call
+        with open(framework_path, 'wb') as f:
+            f.write(framework_content.encode('utf-8'))
         
         return jsonify({
             'success': True,
@@ -99,29 +267,72 @@ def save_framework():
 
 @app.route('/api/frameworks')
 def list_frameworks():
-    """List all saved frameworks"""
-    frameworks = []
-    for framework_id, framework_data in server.frameworks.items():
-        frameworks.append({
-            'id': framework_id,
-            'title': framework_data['title'],
-            'created_at': framework_data['created_at']
-        })
-    
-    return jsonify(frameworks)
+    """List saved frameworks, newest first (?limit=&offset= to page)"""
+    limit = request.args.get('limit', 100, type=int)
+    offset = request.args.get('offset', 0, type=int)
+    return Response(server.list_frameworks_json(limit, offset), mimetype='application/json')
 
 @app.route('/api/framework/<framework_id>')
 def get_framework(framework_id):
     """Get a specific framework"""
-    if framework_id in server.frameworks:
-        return jsonify(server.frameworks[framework_id])
+    framework = server.get_framework(framework_id)
+    if framework is not None:
+        return jsonify(framework)
     else:
         return jsonify({'error': 'Framework not found'}), 404
 
+# lru_cache doesn't serialize concurrent misses; one build at a time keeps
+# two requests from running the analysis on the shared analyzer together
+_analysis_lock = threading.Lock()
+
+def _analyze_sample_data(path, mtime_ns):
+    """
+    Sample data analysis response for (path, mtime), built at most once
+    
+    Returns:
+        dict: Content-Encoding ('identity', 'gzip', 'br') -> response body
+    """
+    with _analysis_lock:
+        return _build_sample_analysis(path, mtime_ns)
+
+@functools.lru_cache(maxsize=4)
+def _build_sample_analysis(path, mtime_ns):
+    """
+    Run the sample data analysis once per (path, mtime) and keep the
+    serialized response, pre-compressed for each supported encoding
+    
+    Returns:
+        dict: Content-Encoding ('identity', 'gzip', 'br') -> response body
+    """
+    # Reuse the analyzer initialize_analysis_tools loaded unless the file has
+    # changed since; a fresh load stays local to this call
+    analyzer = server.data_analyzer
+    if (analyzer is None or analyzer.data_path != path
+            or server.data_analyzer_mtime_ns != mtime_ns):
+        from main_analysis import ThesisDataAnalyzer
+        analyzer = ThesisDataAnalyzer(path)
+    
+    df = analyzer.data
+    analysis_results = {
+        'summary_stats': df.describe().to_dict(),
+        'correlations': analyzer.correlation_analysis(plot=False).to_dict(),
+        'missing_values': df.isna().sum().to_dict(),
+        'data_shape': df.shape,
+        'columns': list(df.columns)
+    }
+    
+    body = orjson.dumps({'success': True, 'analysis': analysis_results},
+                        option=OrjsonProvider.option)
+    bodies = {'identity': body, 'gzip': gzip.compress(body, compresslevel=6)}
+    if brotli is not None:
+        bodies['br'] = brotli.compress(body, quality=4)
+    return bodies
+
 @app.route('/api/analyze-sample-data')
 def analyze_sample_data():
     """Analyze the sample data and return insights"""
     try:
+        analysis_ready.wait(timeout=5)
         if not server.data_analyzer:
             server.initialize_analysis_tools()
         
@@ -131,19 +342,18 @@ def analyze_sample_data():
                 'error': 'Data analysis tools not available'
             })
         
-        # Perform basic analysis
-        analysis_results = {
-            'summary_stats': server.data_analyzer.get_summary_statistics(),
-            'correlations': server.data_analyzer.correlation_analysis(),
-            'missing_values': server.data_analyzer.explore_missing_values(),
-            'data_shape': server.data_analyzer.data.shape,
-            'columns': list(server.data_analyzer.data.columns)
-        }
+        # The analysis only depends on the file, so reuse it until it changes
+        mtime_ns = os.stat(SAMPLE_DATA_PATH).st_mtime_ns
+        bodies = _analyze_sample_data(SAMPLE_DATA_PATH, mtime_ns)
         
-        return jsonify({
-            'success': True,
-            'analysis': analysis_results
-        })
+        # Serve the best pre-compressed body the client accepts
+        encoding = next((enc for enc in ('br', 'gzip')
+                         if enc in bodies and enc in request.accept_encodings), 'identity')
+        response = Response(bodies[encoding], mimetype='application/json')
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+        response.vary.add('Accept-Encoding')
+        return response
         
     except Exception as e:
         return jsonify({
@@ -158,6 +368,7 @@ def preprocess_data():
         data = request.json
         preprocessing_config = data.get('config', {})
         
+        analysis_ready.wait(timeout=5)
         if not server.preprocessor:
             server.initialize_analysis_tools()
         
@@ -167,37 +378,27 @@ def preprocess_data():
                 'error': 'Preprocessing tools not available'
             })
         
-        # Apply preprocessing based on configuration
-        results = {}
+        # Apply preprocessing based on configuration; numeric stages (missing
+        # values, outliers, scaling) and categorical stages (missing values,
+        # encoding) run concurrently on their own column groups
+        with server.preprocessor_lock:
+            server.preprocessor.apply_config(preprocessing_config)
+            data_shape = server.preprocessor.data.shape
         
-        # Handle missing values
+        results = {}
         if preprocessing_config.get('handle_missing'):
-            method = preprocessing_config.get('missing_method', 'auto')
-            server.preprocessor.handle_missing_values(method=method)
             results['missing_values_handled'] = True
-        
-        # Handle outliers
         if preprocessing_config.get('handle_outliers'):
-            method = preprocessing_config.get('outlier_method', 'iqr')
-            server.preprocessor.handle_outliers(method=method)
             results['outliers_handled'] = True
-        
-        # Encode categorical variables
         if preprocessing_config.get('encode_categorical'):
-            method = preprocessing_config.get('encoding_method', 'label')
-            server.preprocessor.encode_categorical_variables(method=method)
             results['categorical_encoded'] = True
-        
-        # Scale numerical features
         if preprocessing_config.get('scale_features'):
-            method = preprocessing_config.get('scaling_method', 'standard')
-            server.preprocessor.scale_numerical_features(method=method)
             results['features_scaled'] = True
         
         return jsonify({
             'success': True,
             'results': results,
-            'data_shape': server.preprocessor.data.shape
+            'data_shape': data_shape
         })
         
     except Exception as e:
@@ -206,29 +407,28 @@ def preprocess_data():
             'error': str(e)
         }), 500
 
-def generate_framework_content(data):
-    """Generate framework content from form data"""
-    content = f"""# THESIS WRITING FRAMEWORK
+# Markdown template for saved frameworks, parsed once at import
+_FRAMEWORK_TEMPLATE = Template("""# THESIS WRITING FRAMEWORK
 
 ## Research Overview
-**Field/Area**: {data.get('researchArea', 'Not specified')}
-**Tentative Title**: {data.get('tentativeTitle', 'Not specified')}
+**Field/Area**: ${research_area}
+**Tentative Title**: ${tentative_title}
 
 ## Problem Statement
-{data.get('problemStatement', 'Not specified')}
+${problem_statement}
 
 ## Research Objectives
-{chr(10).join([f"{i+1}. {obj}" for i, obj in enumerate(data.get('objectives', [])) if obj.strip()])}
+${objectives}
 
 ## Key Research Questions
-{chr(10).join([f"{i+1}. {q}" for i, q in enumerate(data.get('keyQuestions', [])) if q.strip()])}
+${key_questions}
 
 ## Methodology Approach
-{data.get('methodology', 'Not specified')}
+${methodology}
 
 ## Timeline & Resources
-**Timeframe**: {data.get('timeframe', 'Not specified')}
-**Required Resources**: {data.get('resources', 'Not specified')}
+**Timeframe**: ${timeframe}
+**Required Resources**: ${resources}
 
 ## Integration with Thesis Project Framework:
 
@@ -270,26 +470,53 @@ def generate_framework_content(data):
 ---
 *Generated by Thesis Framework Assistant*
 *Integrated with Python Data Analysis Framework*
-*Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
-"""
-    return content
+*Created: ${created}*
+""")
+
+def _numbered(items):
+    """Number the non-blank entries of a form list consecutively, one per line"""
+    entries = [item for item in items if item and item.strip()]
+    return '\n'.join(f"{i}. {item}" for i, item in enumerate(entries, 1))
+
+def generate_framework_content(data, now=None):
+    """Generate framework content from form data, stamped with now (default: current time)"""
+    if now is None:
+        now = datetime.now()
+    return _FRAMEWORK_TEMPLATE.substitute(
+        research_area=data.get('researchArea', 'Not specified'),
+        tentative_title=data.get('tentativeTitle', 'Not specified'),
+        problem_statement=data.get('problemStatement', 'Not specified'),
+        objectives=_numbered(data.get('objectives', ())),
+        key_questions=_numbered(data.get('keyQuestions', ())),
+        methodology=data.get('methodology', 'Not specified'),
+        timeframe=data.get('timeframe', 'Not specified'),
+        resources=data.get('resources', 'Not specified'),
+        created=f"{now:%Y-%m-%d %H:%M:%S}"
+    )
+
+# Pre-encoded health responses up to the timestamp, keyed by analyzer availability
+_HEALTH_PREFIX = {
+    available: orjson.dumps({'status': 'healthy', 'analysis_tools_available': available})[:-1]
+    + b',"timestamp":"'
+    for available in (True, False)
+}
 
 @app.route('/api/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
-        'analysis_tools_available': server.data_analyzer is not None
-    })
+    body = (_HEALTH_PREFIX[server.data_analyzer is not None]
+            + datetime.now().isoformat().encode('ascii') + b'"}')
+    return Response(body, mimetype='application/json')
 
 if __name__ == '__main__':
     print("Starting Thesis Framework Web Interface...")
     print("Access the interface at: http://localhost:5000")
     print("Press Ctrl+C to stop the server")
     
-    # Initialize analysis tools
-    server.initialize_analysis_tools()
+    # Initialize analysis tools in the background while the server starts
+    start_warm_up()
     
-    # Run the Flask app
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Serve with waitress: a thread pool, so slow analysis requests don't
+    # block static files or the health check (no debug reloader fork)
+    from waitress import serve
+    serve(app, host='0.0.0.0', port=5000, threads=8)
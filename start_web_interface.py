@@ -6,43 +6,51 @@ Run this script from the project root to start the web interface
 
 import os
 import sys
-import subprocess
+import importlib.util
 import webbrowser
 import time
 
+# Project paths, resolved once and independent of the later chdir
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_WEB_INTERFACE = os.path.join(_HERE, 'code', 'web-interface')
+_DATA_ANALYSIS = os.path.join(_HERE, 'code', 'data-analysis')
+_TOOLS = os.path.join(_HERE, 'code', 'tools')
+
 def main():
     print("🎓 Thesis Framework Web Interface Launcher")
     print("=" * 50)
     
     # Check if we're in the right directory
-    if not os.path.exists('code/web-interface'):
+    if not os.path.exists(_WEB_INTERFACE):
         print("❌ Error: Web interface not found!")
         print("Please run this script from the project root directory.")
         return
     
     # Change to web interface directory
-    os.chdir('code/web-interface')
+    os.chdir(_WEB_INTERFACE)
+    sys.path.insert(0, _WEB_INTERFACE)
     
-    # Check if Flask is installed
-    try:
-        import flask
-        print("✅ Flask is installed")
-    except ImportError:
-        print("❌ Flask is not installed. Installing...")
-        subprocess.check_call([sys.executable, '-m', 'pip', 'install', 'flask'])
-        print("✅ Flask installed successfully")
+    # Check the server dependencies are installed (find_spec locates them
+    # without importing them)
+    missing = [name for name in ('flask', 'waitress', 'orjson')
+               if importlib.util.find_spec(name) is None]
+    if missing:
+        print(f"❌ Error: Missing server dependencies: {', '.join(missing)}")
+        print("Please install them first: pip install -r requirements.txt")
+        return
+    print("✅ Flask is installed")
     
     # Check if required Python modules are available
     try:
-        sys.path.append(os.path.join(os.path.dirname(__file__), 'code', 'data-analysis'))
-        sys.path.append(os.path.join(os.path.dirname(__file__), 'code', 'tools'))
+        sys.path.append(_DATA_ANALYSIS)
+        sys.path.append(_TOOLS)
         
-        # Try to import analysis modules
-        try:
-            from main_analysis import ThesisDataAnalyzer
-            from preprocess import DataPreprocessor
+        # Check the analysis modules can be found; the server imports them
+        # on first use
+        if all(importlib.util.find_spec(name) is not None
+               for name in ('main_analysis', 'preprocess', 'pandas')):
             print("✅ Data analysis modules available")
-        except ImportError:
+        else:
             print("⚠️  Warning: Data analysis modules not available")
             print("   Some features may be limited")
     except Exception as e:
@@ -57,7 +65,8 @@ def main():
     # Start the server
     try:
         # Import and run the server
-        from server import app
+        from server import app, start_warm_up
+        start_warm_up()
         print("✅ Server started successfully!")
         
         # Open browser after a short delay
@@ -70,8 +79,9 @@ def main():
         browser_thread.daemon = True
         browser_thread.start()
         
-        # Run the Flask app
-        app.run(debug=False, host='0.0.0.0', port=5000)
+        # Run the Flask app on waitress' multi-threaded WSGI server
+        from waitress import serve
+        serve(app, host='0.0.0.0', port=5000, threads=8)
         
     except KeyboardInterrupt:
         print("\n👋 Server stopped by user")
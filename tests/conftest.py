@@ -0,0 +1,10 @@
+"""
+Make the analysis scripts importable from the test suite
+"""
+
+import os
+import sys
+
+_CODE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'code')
+sys.path.insert(0, os.path.join(_CODE, 'data-analysis'))
+sys.path.insert(0, os.path.join(_CODE, 'tools'))
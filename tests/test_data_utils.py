@@ -0,0 +1,19 @@
+"""
+Tests for DataUtils in code/tools/data_utils.py
+"""
+
+import pandas as pd
+
+from data_utils import DataUtils
+
+
+def test_summary_unique_count_ignores_unused_categories():
+    df = pd.DataFrame({
+        'level': pd.Categorical(['low', 'high', 'low'], categories=['low', 'mid', 'high']),
+        'empty': pd.Categorical([None, None, None], categories=['x', 'y']),
+    })
+    
+    info = DataUtils.create_summary_statistics(df)['categorical_info']
+    
+    assert info['level'] == {'unique_count': 2, 'most_common': 'low', 'most_common_count': 2}
+    assert info['empty'] == {'unique_count': 0, 'most_common': None, 'most_common_count': 0}
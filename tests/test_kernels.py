@@ -0,0 +1,28 @@
+"""
+Tests for the numeric kernels in code/data-analysis/_kernels.py
+"""
+
+import numpy as np
+
+import _kernels
+from _kernels import corr_matrix
+
+
+def test_corr_matrix_constant_column_is_nan():
+    rng = np.random.default_rng(0)
+    X = np.column_stack([rng.normal(size=50), np.full(50, 3.0), rng.normal(size=50)])
+    
+    corr = corr_matrix(X)
+    
+    assert np.isnan(corr[1]).all() and np.isnan(corr[:, 1]).all()
+    np.testing.assert_allclose(corr[[0, 2]][:, [0, 2]], np.corrcoef(X[:, [0, 2]], rowvar=False))
+
+
+def test_corr_matrix_loop_constant_column_is_nan():
+    # The pure-Python loop is what the ahead-of-time build compiles
+    X = np.column_stack([np.arange(10.0), np.zeros(10)])
+    
+    corr = _kernels._corr_matrix_loop(X)
+    
+    assert corr[0, 0] == 1.0
+    assert np.isnan(corr[0, 1]) and np.isnan(corr[1, 0]) and np.isnan(corr[1, 1])
@@ -0,0 +1,99 @@
+"""
+Tests for ThesisDataAnalyzer in code/data-analysis/main_analysis.py
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from main_analysis import ThesisDataAnalyzer
+
+
+def _analyzer(df, backend='pandas'):
+    analyzer = ThesisDataAnalyzer(backend=backend)
+    analyzer.data = df
+    return analyzer
+
+
+def test_chi_square_on_categorical_columns_does_not_raise():
+    df = pd.DataFrame({
+        'group': ['a', 'b', 'a', 'b', 'a', 'b'],
+        'answer': ['yes', 'no', 'no', 'yes', 'yes', 'yes'],
+    })
+    analyzer = _analyzer(df)
+    
+    analyzer.statistical_tests('group', 'answer', test_type='chi_square')
+    
+    assert 't_test' not in analyzer.results and 'anova' not in analyzer.results
+
+
+def test_downcast_keeps_float64_when_float32_loses_precision(tmp_path):
+    pytest.importorskip('polars')
+    path = tmp_path / 'data.csv'
+    pd.DataFrame({
+        'income': [22026.465794806718, 98765.4321, 12345.6789],
+        'score': [0.5, 1.25, 2.0],
+        'n': [1, 2, 300],
+    }).to_csv(path, index=False)
+    
+    dtypes = {backend: ThesisDataAnalyzer(str(path), backend=backend).data.dtypes
+              for backend in ('pandas', 'polars')}
+    
+    assert dtypes['pandas']['income'] == np.float64
+    assert dtypes['pandas']['score'] == np.float32
+    pd.testing.assert_series_equal(dtypes['pandas'], dtypes['polars'])
+
+
+def _grouped_data(n=120, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'g2': rng.choice(['a', 'b'], n),
+        'g3': rng.choice(['low', 'mid', 'high'], n),
+        'x1': rng.normal(size=n),
+        'x2': rng.normal(size=n),
+    })
+    df['y'] = 1.5 + 2.0 * df['x1'] - 0.5 * df['x2'] + rng.normal(scale=0.3, size=n)
+    return df
+
+
+@pytest.mark.parametrize('backend', ['pandas', 'polars'])
+def test_regress_by_matches_statsmodels_per_group(backend, tmp_path):
+    sm = pytest.importorskip('statsmodels.api')
+    df = _grouped_data()
+    if backend == 'polars':
+        pytest.importorskip('polars')
+        path = tmp_path / 'data.csv'
+        df.to_csv(path, index=False)
+        analyzer = ThesisDataAnalyzer(backend='polars')
+        analyzer.load_data(str(path), preserve_precision=True)
+    else:
+        analyzer = _analyzer(df)
+    
+    results = analyzer.regress_by('g3', 'y', ['x1', 'x2'])
+    
+    for group, block in df.groupby('g3'):
+        model = sm.OLS(block['y'], sm.add_constant(block[['x1', 'x2']])).fit()
+        row = results.loc[group]
+        np.testing.assert_allclose(row[['const', 'x1', 'x2']].to_numpy(dtype=float),
+                                   model.params[['const', 'x1', 'x2']].to_numpy(), rtol=1e-6)
+        np.testing.assert_allclose(row['r_squared'], model.rsquared, rtol=1e-6)
+        assert row['n'] == len(block)
+
+
+def test_batch_tests_match_scipy():
+    stats = pytest.importorskip('scipy.stats')
+    df = _grouped_data()
+    analyzer = _analyzer(df)
+    
+    results = analyzer.batch_tests(group_vars=['g2', 'g3'], test_vars=['x1', 'y'])
+    
+    for test_var in ('x1', 'y'):
+        t_stat, t_p = stats.ttest_ind(df.loc[df['g2'] == 'a', test_var],
+                                      df.loc[df['g2'] == 'b', test_var])
+        row = results.loc[('g2', test_var)]
+        np.testing.assert_allclose([row['t_statistic'], row['t_p_value']], [t_stat, t_p], rtol=1e-8)
+        
+        f_stat, f_p = stats.f_oneway(*[block[test_var] for _, block in df.groupby('g3')])
+        row = results.loc[('g3', test_var)]
+        np.testing.assert_allclose([row['f_statistic'], row['f_p_value']], [f_stat, f_p], rtol=1e-8)
+        assert np.isnan(row['t_statistic'])
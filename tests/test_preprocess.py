@@ -0,0 +1,116 @@
+"""
+Tests for DataPreprocessor in code/data-analysis/preprocess.py
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from preprocess import DataPreprocessor, pl
+
+
+def _preprocessor(df, backend, tmp_path):
+    # pandas frames stay on the pandas path, so the polars path is only
+    # exercised through load_data
+    if backend == 'pandas':
+        return DataPreprocessor(df, backend='pandas')
+    if pl is None:
+        pytest.skip('polars not installed')
+    path = tmp_path / 'data.csv'
+    df.to_csv(path, index=False)
+    preprocessor = DataPreprocessor(backend='polars')
+    preprocessor.load_data(str(path), preserve_precision=True)
+    return preprocessor
+
+
+@pytest.mark.parametrize('backend', ['pandas', 'polars'])
+def test_mode_fill_ignores_majority_nulls(backend, tmp_path):
+    df = pd.DataFrame({
+        'label': ['a', None, None, 'b', 'c', 'a', None],
+        'value': [1.0, np.nan, np.nan, 2.0, np.nan, 2.0, np.nan],
+    })
+    preprocessor = _preprocessor(df, backend, tmp_path)
+    
+    preprocessor.handle_missing_values(strategy='mode')
+    
+    result = preprocessor.data
+    assert result.isna().sum().sum() == 0
+    assert (result['label'] == ['a', 'a', 'a', 'b', 'c', 'a', 'a']).all()
+    assert (result['value'] == [1.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0]).all()
+
+
+@pytest.mark.parametrize('backend', ['pandas', 'polars'])
+def test_auto_fill_uses_mode_for_strings(backend, tmp_path):
+    df = pd.DataFrame({'label': ['a', None, None, 'b', 'c', 'a', None]})
+    preprocessor = _preprocessor(df, backend, tmp_path)
+    
+    preprocessor.handle_missing_values(strategy='auto')
+    
+    assert (preprocessor.data['label'] == 'a').sum() == 5
+
+
+def test_missing_values_keep_a_non_default_index():
+    # e.g. the gaps handle_outliers(method='remove') leaves behind
+    index = pd.Index([3, 7, 8, 12, 20], name='row')
+    df = pd.DataFrame({'value': [1.0, np.nan, 3.0, np.nan, 5.0],
+                       'label': ['a', 'b', None, 'b', 'a']}, index=index)
+    preprocessor = DataPreprocessor(df)
+    
+    preprocessor.handle_missing_values(strategy='auto')
+    
+    pd.testing.assert_index_equal(preprocessor.data.index, index)
+    assert preprocessor.data.loc[7, 'value'] == 3.0
+    assert preprocessor.data.loc[8, 'label'] in ('a', 'b')
+
+
+def test_apply_config_reports_numeric_then_categorical(capsys):
+    df = pd.DataFrame({'value': [1.0, np.nan, 3.0, 4.0],
+                       'label': ['a', None, 'b', 'a']})
+    preprocessor = DataPreprocessor(df, backend='pandas')
+    
+    preprocessor.apply_config({'handle_missing': True, 'encode_categorical': True})
+    
+    out = capsys.readouterr().out
+    assert out.index('Processing column: value') < out.index('Processing column: label')
+    assert out.index('ENCODING CATEGORICAL') < out.index('Final shape after preprocessing')
+    assert preprocessor.data.isna().sum().sum() == 0
+    assert list(preprocessor.data.columns) == ['value', 'label']
+
+
+@pytest.mark.parametrize('backend', ['pandas', 'polars'])
+def test_mode_fill_breaks_ties_by_smallest_value(backend, tmp_path):
+    df = pd.DataFrame({'label': ['b', 'a', None, 'b', 'a'],
+                       'value': [5.0, 2.0, np.nan, 2.0, 5.0]})
+    preprocessor = _preprocessor(df, backend, tmp_path)
+    
+    preprocessor.handle_missing_values(strategy='mode')
+    
+    assert preprocessor.data['label'].iloc[2] == 'a'
+    assert preprocessor.data['value'].iloc[2] == 2.0
+
+
+def test_run_pipeline_matches_calling_the_methods():
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({
+        'income': rng.lognormal(10, 0.5, 200),
+        'age': rng.normal(35, 10, 200),
+        'education': rng.choice(['PhD', 'Bachelor', 'Master'], 200),
+    })
+    df.loc[rng.choice(200, 20, replace=False), 'income'] = np.nan
+    
+    stepwise = DataPreprocessor(df.copy(), backend='pandas')
+    stepwise.handle_missing_values(strategy='median')
+    stepwise.handle_outliers(method='cap')
+    stepwise.scale_features(method='standard')
+    stepwise.encode_categorical_variables(method='label')
+    
+    piped = DataPreprocessor(df.copy(), backend='pandas')
+    piped.run_pipeline([
+        ('fillna', 'median', None),
+        ('clip_outliers', 0.01, 0.99, None),
+        ('scale', 'standard', None),
+        ('label_encode', None),
+    ])
+    
+    pd.testing.assert_frame_equal(piped.data, stepwise.data, check_dtype=False)
+    pd.testing.assert_index_equal(piped.encoders['education'], stepwise.encoders['education'])